@@ -8,8 +8,10 @@
 
 # Import libraries
 from datetime import date, datetime
+from functools import lru_cache
 from rdflib import Namespace
 from rdflib.term import Literal, URIRef, _is_valid_uri
+from re import compile, escape
 from urllib.parse import quote, unquote
 from validators import url
 
@@ -32,10 +34,60 @@ ISIL = Namespace('https://ld.zdb-services.de/resource/organisations/')
 SCHEMA = Namespace('http://schema.org/')
 TGN = Namespace('https://vocab.getty.edu/tgn/')
 
+# Number of inputs to remember in URI and date checks
+uri_cache_size:int = 65536
+date_cache_size:int = 16384
+
+# Shapes of date strings, the second one matching every possible ISO 8601 date
+date_pattern = compile('[0-9]{4}-[0-9]{2}-[0-9]{2}')
+iso_date_pattern = compile('[0-9]{4}[-W0-9]')
+
+# Known namespace aliases and their regular replacements
+namespace_aliases:dict = {
+    'http://www.wikidata.org/wiki/': str(WD),
+    'https://www.wikidata.org/wiki/': str(WD),
+    'http://vocab.getty.edu/page/aat/': str(AAT),
+    'https://vocab.getty.edu/page/aat/': str(AAT),
+    'http://vocab.getty.edu/resource/aat/': str(AAT),
+    'https://vocab.getty.edu/resource/aat/': str(AAT),
+    'http://www.geonames.org/': str(GN),
+    'https://www.geonames.org/': str(GN)
+}
+namespace_aliases_pattern = compile('|'.join([escape(alias) for alias in namespace_aliases]))
+
+# Namespaces to correct 'http' and 'https' mistakes for, keyed without their scheme
+namespace_schemes:dict = {namespace.split('://', 1)[1]: namespace for namespace in [
+    str(CTO2),
+    str(CTO3),
+    str(MO),
+    str(NFDICORE),
+    str(OWL),
+    str(RDF),
+    str(RDFS),
+    str(SCHEMA), # Not using SDO here later helps unifying SDO to SCHEMA
+    str(XSD),
+    str(N4C),
+    str(GN),
+    str(IC),
+    str(AAT),
+    str(GND),
+    str(WD),
+    str(VIAF),
+    str(RISM),
+    str(FG),
+    str(ISIL),
+    str(TGN)
+]}
+namespace_schemes_pattern = compile('https?://(' + '|'.join([escape(namespace) for namespace in sorted(namespace_schemes, key = len, reverse = True)]) + ')')
+
 
 class Uri:
 
 
+    # Fixed attributes instead of a per-instance dict
+    __slots__ = ('uri',)
+
+
     def __init__(self, uri:str|Literal|URIRef|None = None, normalize:bool = True):
         '''
         Generic URI node
@@ -48,34 +100,9 @@ class Uri:
         # Content vars
         self.uri:str|None = None
 
-        # Save URIRef
-        if isinstance(uri, URIRef):
-            if _is_valid_uri(str(uri)) and url(str(uri)):
-                if normalize:
-                    self.uri = clean_namespaces(str(uri))
-                else:
-                    self.uri = str(uri)
-
-        # Save Literal
-        elif isinstance(uri, Literal):
-            if _is_valid_uri(str(uri)) and url(str(uri)):
-                if normalize:
-                    self.uri = clean_namespaces(str(uri))
-                else:
-                    self.uri = str(uri)
-
-        # Save str
-        elif isinstance(uri, str):
-            if _is_valid_uri(uri) and url(uri):
-                if normalize:
-                    self.uri = clean_namespaces(uri)
-                else:
-                    self.uri = uri
-
-        # Clean up square brackets not caught by previous checks
-        if self.uri != None:
-            self.uri = self.uri.replace('[', '%5B')
-            self.uri = self.uri.replace(']', '%5D')
+        # Save validated and normalised URIRef, Literal, or str
+        if isinstance(uri, str):
+            self.uri = clean_uri(str(uri), normalize)
 
 
     def __bool__(self) -> bool:
@@ -93,6 +120,36 @@ class Uri:
             return False
 
 
+    def __eq__(self, other) -> bool:
+        '''
+        Compare URI nodes by value
+
+            Parameters:
+                other (any): Object to compare with
+
+            Returns:
+                bool: Whether or not both objects hold the same URI
+        '''
+
+        # Compare content
+        if isinstance(other, Uri):
+            return self.uri == other.uri
+        else:
+            return NotImplemented
+
+
+    def key(self) -> str|None:
+        '''
+        Snapshot of the content to compare and deduplicate by
+
+            Returns:
+                str|None: Hashable URI
+        '''
+
+        # Return key
+        return self.uri
+
+
     def __str__(self) -> str:
         '''
         String representation of the object
@@ -135,6 +192,10 @@ class Uri:
 class UriList:
 
 
+    # Fixed attributes instead of a per-instance dict
+    __slots__ = ('uris',)
+
+
     def __init__(self, uris:list|str|Literal|URIRef|None = None, normalize:bool = True):
         '''
         List of generic URI nodes
@@ -158,8 +219,8 @@ class UriList:
                 if uri:
                     self.uris.append(uri)
 
-        # Remove duplicates
-        self.uris = list(set(self.uris))
+        # Remove duplicates but keep the order
+        self.uris = unique(self.uris)
 
 
     def __bool__(self) -> bool:
@@ -177,6 +238,49 @@ class UriList:
             return False
 
 
+    def __eq__(self, other) -> bool:
+        '''
+        Compare lists of URI nodes by value
+
+            Parameters:
+                other (any): Object to compare with
+
+            Returns:
+                bool: Whether or not both objects hold the same URIs
+        '''
+
+        # Compare content
+        if isinstance(other, UriList):
+            return self.key() == other.key()
+        else:
+            return NotImplemented
+
+
+    def key(self) -> frozenset:
+        '''
+        Snapshot of the content to compare and deduplicate by
+
+            Returns:
+                frozenset: Hashable URIs, regardless of their order
+        '''
+
+        # Return key
+        return frozenset(i.key() for i in self.uris)
+
+
+    def add(self, uri:Uri):
+        '''
+        Add a URI node unless it is empty or already in the list
+
+            Parameters:
+                uri (Uri): Node to add
+        '''
+
+        # Append new content only
+        if uri and uri not in self.uris:
+            self.uris.append(uri)
+
+
     def __str__(self) -> str:
         '''
         String representation of the object
@@ -219,6 +323,10 @@ class UriList:
 class Label:
 
 
+    # Fixed attributes instead of a per-instance dict
+    __slots__ = ('label', 'language', 'data_type')
+
+
     def __init__(self, label:str|Literal|URIRef|None = None, data_type:str|Literal|URIRef|None = None, remove_path:str|None = None):
         '''
         Generic string literal node
@@ -277,6 +385,36 @@ class Label:
             return False
 
 
+    def __eq__(self, other) -> bool:
+        '''
+        Compare string literal nodes by value
+
+            Parameters:
+                other (any): Object to compare with
+
+            Returns:
+                bool: Whether or not both objects hold the same label, language, and data type
+        '''
+
+        # Compare content
+        if isinstance(other, Label):
+            return (self.label, self.language, self.data_type) == (other.label, other.language, other.data_type)
+        else:
+            return NotImplemented
+
+
+    def key(self) -> tuple:
+        '''
+        Snapshot of the content to compare and deduplicate by
+
+            Returns:
+                tuple: Hashable label, language, and data type
+        '''
+
+        # Return key
+        return (self.label, self.language, self.data_type.key())
+
+
     def __str__(self) -> str:
         '''
         String representation of the object
@@ -338,6 +476,10 @@ class Label:
 class LabelList:
 
 
+    # Fixed attributes instead of a per-instance dict
+    __slots__ = ('labels',)
+
+
     def __init__(self, labels:list|str|Literal|URIRef|None = None, data_type:str|Literal|URIRef|None = None):
         '''
         List of generic string literal nodes
@@ -361,8 +503,8 @@ class LabelList:
                 if label:
                     self.labels.append(label)
 
-        # Remove duplicates
-        self.labels = list(set(self.labels))
+        # Remove duplicates but keep the order
+        self.labels = unique(self.labels)
 
 
     def __bool__(self) -> bool:
@@ -380,6 +522,49 @@ class LabelList:
             return False
 
 
+    def __eq__(self, other) -> bool:
+        '''
+        Compare lists of string literal nodes by value
+
+            Parameters:
+                other (any): Object to compare with
+
+            Returns:
+                bool: Whether or not both objects hold the same labels
+        '''
+
+        # Compare content
+        if isinstance(other, LabelList):
+            return self.key() == other.key()
+        else:
+            return NotImplemented
+
+
+    def key(self) -> frozenset:
+        '''
+        Snapshot of the content to compare and deduplicate by
+
+            Returns:
+                frozenset: Hashable labels, regardless of their order
+        '''
+
+        # Return key
+        return frozenset(i.key() for i in self.labels)
+
+
+    def add(self, label:Label):
+        '''
+        Add a string literal node unless it is empty or already in the list
+
+            Parameters:
+                label (Label): Node to add
+        '''
+
+        # Append new content only
+        if label and label not in self.labels:
+            self.labels.append(label)
+
+
     def __str__(self) -> str:
         '''
         String representation of the object
@@ -422,6 +607,10 @@ class LabelList:
 class UriLabel:
 
 
+    # Fixed attributes instead of a per-instance dict
+    __slots__ = ('uri', 'labels')
+
+
     def __init__(self, uri:str|Literal|URIRef|None = None, labels:list|str|Literal|URIRef|None = None, combined:str|tuple|Literal|URIRef|None = None):
         '''
         Combined node of a URI and a list of string literals
@@ -445,12 +634,12 @@ class UriLabel:
 
             # Literal and string may be URI or label
             if isinstance(combined, Literal):
-                if _is_valid_uri(str(combined)) and url(str(combined)):
+                if is_uri(str(combined)):
                     self.uri = Uri(str(combined))
                 else:
                     self.labels = LabelList(combined)
             if isinstance(combined, str):
-                if _is_valid_uri(combined) and url(combined):
+                if is_uri(combined):
                     self.uri = Uri(combined)
                 else:
                     self.labels = LabelList(combined)
@@ -486,6 +675,36 @@ class UriLabel:
             return False
 
 
+    def __eq__(self, other) -> bool:
+        '''
+        Compare URI nodes with labels by value
+
+            Parameters:
+                other (any): Object to compare with
+
+            Returns:
+                bool: Whether or not both objects hold the same URI and labels
+        '''
+
+        # Compare content
+        if isinstance(other, UriLabel):
+            return (self.uri, self.labels) == (other.uri, other.labels)
+        else:
+            return NotImplemented
+
+
+    def key(self) -> tuple:
+        '''
+        Snapshot of the content to compare and deduplicate by
+
+            Returns:
+                tuple: Hashable URI and labels
+        '''
+
+        # Return key
+        return (self.uri.key(), self.labels.key())
+
+
     def __str__(self) -> str:
         '''
         String representation of the object
@@ -536,6 +755,10 @@ class UriLabel:
 class UriLabelList:
 
 
+    # Fixed attributes instead of a per-instance dict
+    __slots__ = ('uri_labels',)
+
+
     def __init__(self, uri_labels:list|str|tuple|Literal|URIRef|None = None):
         '''
         List of combined nodes of a URI and a list of string literals
@@ -558,8 +781,8 @@ class UriLabelList:
                 if uri_label:
                     self.uri_labels.append(uri_label)
 
-        # Remove duplicates
-        self.uri_labels = list(set(self.uri_labels))
+        # Remove duplicates but keep the order
+        self.uri_labels = unique(self.uri_labels)
 
 
     def __bool__(self) -> bool:
@@ -577,6 +800,49 @@ class UriLabelList:
             return False
 
 
+    def __eq__(self, other) -> bool:
+        '''
+        Compare lists of URI nodes with labels by value
+
+            Parameters:
+                other (any): Object to compare with
+
+            Returns:
+                bool: Whether or not both objects hold the same URIs and labels
+        '''
+
+        # Compare content
+        if isinstance(other, UriLabelList):
+            return self.key() == other.key()
+        else:
+            return NotImplemented
+
+
+    def key(self) -> frozenset:
+        '''
+        Snapshot of the content to compare and deduplicate by
+
+            Returns:
+                frozenset: Hashable URIs and labels, regardless of their order
+        '''
+
+        # Return key
+        return frozenset(i.key() for i in self.uri_labels)
+
+
+    def add(self, uri_label:UriLabel):
+        '''
+        Add a URI node with labels unless it is empty or already in the list
+
+            Parameters:
+                uri_label (UriLabel): Node to add
+        '''
+
+        # Append new content only
+        if uri_label and uri_label not in self.uri_labels:
+            self.uri_labels.append(uri_label)
+
+
     def __str__(self) -> str:
         '''
         String representation of the object
@@ -619,6 +885,10 @@ class UriLabelList:
 class Date:
 
 
+    # Fixed attributes instead of a per-instance dict
+    __slots__ = ('start', 'start_time', 'end_time', 'label')
+
+
     def __init__(self, input:date|datetime|int|str|Literal|None = None):
         '''
         Generic date literal node
@@ -648,45 +918,12 @@ class Date:
         # Save str or Literal
         elif isinstance(input, (str, Literal)):
 
-            # Convert Literal to str
-            if isinstance(input, Literal):
-                simple_input = str(input)
-            else:
-                simple_input = input
-
-            # Split in two if str contains slash
-            if '/' in simple_input:
-                start_and_end = simple_input.split('/', 1)
-
-                # Check if regular dates or proper datetimes were used
-                try:
-                    self.start_time = datetime.fromisoformat(start_and_end[0] + 'T00:00:00')
-                except (ValueError, TypeError):
-                    try:
-                        self.start_time = datetime.fromisoformat(start_and_end[0])
-                    except (ValueError, TypeError):
-                        pass
-                try:
-                    self.end_time = datetime.fromisoformat(start_and_end[1] + 'T23:59:59')
-                except (ValueError, TypeError):
-                    try:
-                        self.end_time = datetime.fromisoformat(start_and_end[1])
-                    except (ValueError, TypeError):
-                        pass
-
-                # Save string as backup
-                if not self.start_time and not self.end_time:
-                    self.label = Label(input)
-
-            # Convert regular str to date or datetime
-            else:
-                try:
-                    self.start = date.fromisoformat(input)
-                except (ValueError, TypeError):
-                    try:
-                        self.start_time = datetime.fromisoformat(input)
-                    except (ValueError, TypeError):
-                        self.label = Label(input)
+            # Parse dates or date ranges
+            self.start, self.start_time, self.end_time = parse_date(str(input))
+
+            # Save string as backup, keeping the language of a Literal
+            if not self.start and not self.start_time and not self.end_time:
+                self.label = Label(input)
 
 
     def __bool__(self) -> bool:
@@ -704,6 +941,36 @@ class Date:
             return False
 
 
+    def __eq__(self, other) -> bool:
+        '''
+        Compare date literal nodes by value
+
+            Parameters:
+                other (any): Object to compare with
+
+            Returns:
+                bool: Whether or not both objects hold the same dates and label
+        '''
+
+        # Compare content
+        if isinstance(other, Date):
+            return (self.start, self.start_time, self.end_time, self.label) == (other.start, other.start_time, other.end_time, other.label)
+        else:
+            return NotImplemented
+
+
+    def key(self) -> tuple:
+        '''
+        Snapshot of the content to compare and deduplicate by
+
+            Returns:
+                tuple: Hashable dates and label
+        '''
+
+        # Return key
+        return (self.start, self.start_time, self.end_time, self.label.key())
+
+
     def __str__(self) -> str:
         '''
         String representation of the object
@@ -768,6 +1035,10 @@ class Date:
 class DateList:
 
 
+    # Fixed attributes instead of a per-instance dict
+    __slots__ = ('dates',)
+
+
     def __init__(self, dates:list|date|datetime|int|str|Literal|None = None):
         '''
         List of generic date literal node
@@ -790,8 +1061,8 @@ class DateList:
                 if single_date:
                     self.dates.append(single_date)
 
-        # Remove duplicates
-        self.dates = list(set(self.dates))
+        # Remove duplicates but keep the order
+        self.dates = unique(self.dates)
 
 
     def __bool__(self) -> bool:
@@ -809,6 +1080,49 @@ class DateList:
             return False
 
 
+    def __eq__(self, other) -> bool:
+        '''
+        Compare lists of date literal nodes by value
+
+            Parameters:
+                other (any): Object to compare with
+
+            Returns:
+                bool: Whether or not both objects hold the same dates
+        '''
+
+        # Compare content
+        if isinstance(other, DateList):
+            return self.key() == other.key()
+        else:
+            return NotImplemented
+
+
+    def key(self) -> frozenset:
+        '''
+        Snapshot of the content to compare and deduplicate by
+
+            Returns:
+                frozenset: Hashable dates, regardless of their order
+        '''
+
+        # Return key
+        return frozenset(i.key() for i in self.dates)
+
+
+    def add(self, single_date:Date):
+        '''
+        Add a date literal node unless it is empty or already in the list
+
+            Parameters:
+                single_date (Date): Node to add
+        '''
+
+        # Append new content only
+        if single_date and single_date not in self.dates:
+            self.dates.append(single_date)
+
+
     def __str__(self) -> str:
         '''
         String representation of the object
@@ -854,6 +1168,10 @@ class DateList:
 class Incipit:
 
 
+    # Fixed attributes instead of a per-instance dict
+    __slots__ = ('uri', 'clef', 'key', 'key_sig', 'time_sig', 'pattern')
+
+
     def __init__(self, uri:str|Literal|URIRef|None = None, clef:str|Literal|URIRef|None = None, key:str|Literal|URIRef|None = None, key_sig:str|Literal|URIRef|None = None, time_sig:str|Literal|URIRef|None = None, pattern:str|Literal|URIRef|None = None):
         '''
         Incipit node
@@ -931,6 +1249,10 @@ class Incipit:
 class Media:
 
 
+    # Fixed attributes instead of a per-instance dict
+    __slots__ = ('uri', 'type', 'license', 'byline')
+
+
     def __init__(self, uri:str|Literal|URIRef|None = None, type:str = '', license:str|Literal|URIRef|None = None, byline:str|Literal|URIRef|None = None):
         '''
         Media node
@@ -1018,6 +1340,162 @@ class Media:
             return None
 
 
+@lru_cache(maxsize = uri_cache_size)
+def is_url(input:str) -> bool:
+    '''
+    Check whether a string is a URL, remembering recent results
+
+        Parameters:
+            input (str): String to check
+
+        Returns:
+            bool: Whether or not the string is a URL
+    '''
+
+    # Check URL
+    if url(input):
+        return True
+    else:
+        return False
+
+
+def is_uri(input:str) -> bool:
+    '''
+    Check whether a string is a URL that is also a valid RDF URI
+
+        Parameters:
+            input (str): String to check
+
+        Returns:
+            bool: Whether or not the string is a valid URI
+    '''
+
+    # Check RDF validity first as it is cheaper
+    return _is_valid_uri(input) and is_url(input)
+
+
+@lru_cache(maxsize = uri_cache_size)
+def clean_uri(input:str, normalize:bool = True) -> str|None:
+    '''
+    Validate and normalise an incoming URI, remembering recent results
+
+        Parameters:
+            input (str): String to check and transform
+            normalize (bool): Whether to normalize URI quirks
+
+        Returns:
+            str|None: Clean URI or None if the input is not valid
+    '''
+
+    # Skip invalid input
+    if not is_uri(input):
+        return None
+
+    # Normalise namespaces
+    if normalize:
+        input = clean_namespaces(input)
+
+    # Clean up square brackets not caught by previous checks
+    input = input.replace('[', '%5B')
+    input = input.replace(']', '%5D')
+
+    # Return URI
+    return input
+
+
+@lru_cache(maxsize = date_cache_size)
+def parse_date(input:str) -> tuple:
+    '''
+    Classify a date string and parse it accordingly, remembering recent results including misses
+
+        Parameters:
+            input (str): Date, datetime, or range of both separated by a slash
+
+        Returns:
+            tuple: Start date, start datetime, and end datetime, each None if not available
+    '''
+
+    # Split in two if str contains slash
+    if '/' in input:
+        start_and_end = input.split('/', 1)
+        return None, parse_datetime(start_and_end[0], 'T00:00:00'), parse_datetime(start_and_end[1], 'T23:59:59')
+
+    # Regular date
+    elif date_pattern.fullmatch(input):
+        try:
+            return date.fromisoformat(input), None, None
+        except (ValueError, TypeError):
+            return None, None, None
+
+    # Other ISO 8601 dates or datetimes
+    elif iso_date_pattern.match(input):
+        try:
+            return date.fromisoformat(input), None, None
+        except (ValueError, TypeError):
+            try:
+                return None, datetime.fromisoformat(input), None
+            except (ValueError, TypeError):
+                return None, None, None
+
+    # Anything else, e.g. a single year or a textual date
+    else:
+        return None, None, None
+
+
+def parse_datetime(input:str, time:str) -> datetime|None:
+    '''
+    Parse one side of a date range into a datetime
+
+        Parameters:
+            input (str): Date or datetime string
+            time (str): Time to add if the input is a regular date
+
+        Returns:
+            datetime|None: Parsed datetime or None if not available
+    '''
+
+    # Regular date
+    if date_pattern.fullmatch(input):
+        try:
+            return datetime.fromisoformat(input + time)
+        except (ValueError, TypeError):
+            return None
+
+    # Other ISO 8601 dates or datetimes
+    elif iso_date_pattern.match(input):
+        try:
+            return datetime.fromisoformat(input + time)
+        except (ValueError, TypeError):
+            try:
+                return datetime.fromisoformat(input)
+            except (ValueError, TypeError):
+                return None
+
+    # Anything else
+    else:
+        return None
+
+
+def unique(items:list) -> list:
+    '''
+    Remove duplicate data nodes by their content but keep the order
+
+        Parameters:
+            items (list): Data nodes that provide a key
+
+        Returns:
+            list: First data node for each key
+    '''
+
+    # Keep the first node per key
+    output = {}
+    for item in items:
+        output.setdefault(item.key(), item)
+
+    # Return result
+    return list(output.values())
+
+
 def clean_path(input:str, remove_path:str) -> str:
     '''
     Sanitize local file paths of incoming locations
@@ -1057,68 +1535,17 @@ def clean_namespaces(input:str) -> str:
     if input.endswith('/'):
         input = input[:-1]
 
-    # Avoid known Wikidata issues
-    if input.startswith('http://www.wikidata.org/wiki/'):
-        input = input.replace('http://www.wikidata.org/wiki/', str(WD), 1)
-    elif input.startswith('https://www.wikidata.org/wiki/'):
-        input = input.replace('https://www.wikidata.org/wiki/', str(WD), 1)
-
-    # Avoid known Getty AAT issues
-    if input.startswith('http://vocab.getty.edu/page/aat/'):
-        input = input.replace('http://vocab.getty.edu/page/aat/', str(AAT), 1)
-    elif input.startswith('https://vocab.getty.edu/page/aat/'):
-        input = input.replace('https://vocab.getty.edu/page/aat/', str(AAT), 1)
-    elif input.startswith('http://vocab.getty.edu/resource/aat/'):
-        input = input.replace('http://vocab.getty.edu/resource/aat/', str(AAT), 1)
-    elif input.startswith('https://vocab.getty.edu/resource/aat/'):
-        input = input.replace('https://vocab.getty.edu/resource/aat/', str(AAT), 1)
-
-    # Avoid known GeoNames issues
-    if input.startswith('http://www.geonames.org/'):
-        input = input.replace('http://www.geonames.org/', str(GN), 1)
-    elif input.startswith('https://www.geonames.org/'):
-        input = input.replace('https://www.geonames.org/', str(GN), 1)
-
-    # List namespaces to check
-    checks = [
-        str(CTO2),
-        str(CTO3),
-        str(MO),
-        str(NFDICORE),
-        str(OWL),
-        str(RDF),
-        str(RDFS),
-        str(SCHEMA), # Not using SDO here later helps unifying SDO to SCHEMA
-        str(XSD),
-        str(N4C),
-        str(GN),
-        str(IC),
-        str(AAT),
-        str(GND),
-        str(WD),
-        str(VIAF),
-        str(RISM),
-        str(FG),
-        str(ISIL),
-        str(TGN)
-    ]
-
-    # Prepare additional http/https check if not a regular namespace
-    found = False
-    for check in checks:
-        if found == False and check not in input:
-
-            # Switch http and https and test again
-            if input.startswith('http://'):
-                input_copy = input.replace('http://', 'https://', 1)
-                if check in input_copy:
-                    input = input_copy
-                    found == True
-            elif input.startswith('https://'):
-                input_copy = input.replace('https://', 'http://', 1)
-                if check in input_copy:
-                    input = input_copy
-                    found == True
+    # Replace known aliases of Wikidata, Getty AAT, and GeoNames namespaces
+    match = namespace_aliases_pattern.match(input)
+    if match:
+        input = namespace_aliases[match.group()] + input[match.end():]
+
+    # Switch http and https if that yields a regular namespace not used so far
+    match = namespace_schemes_pattern.match(input)
+    if match:
+        namespace = namespace_schemes[match.group(1)]
+        if namespace not in input:
+            input = namespace + input[match.end():]
 
     # Avoid known Iconclass issues (i.e., brackets, spaces, and other characters in IRIs)
     if input.startswith(str(IC)):
@@ -8,6 +8,9 @@
 
 # Import libraries# Import libraries
 import logging
+from collections.abc import Iterator
+from lxml import etree
+from re import compile
 from rdflib.term import BNode, Literal, URIRef
 
 # Import script modules
@@ -17,10 +20,17 @@ import map.beacon as beacon
 import map.csv as csv
 import map.cto as cto
 import map.cto3 as cto3
+import map.parquet as parquet
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Compiled element paths, keyed by paths with namespace placeholders
+xml_path_cache:dict = {}
+
+# Whitespace as understood by XPath's normalize-space()
+xml_whitespace = compile('[ \t\r\n]+')
+
 
 class ExtractInterface:
 
@@ -36,6 +46,8 @@ class ExtractInterface:
         # Vars
         self.success:bool = False
         self.file:File
+        self.xml_text_cache:dict = {}
+        self.xml_lang_cache:dict = {}
 
         # Retrieve file and data
         if file.success == True:
@@ -90,12 +102,13 @@ class ExtractInterface:
             p = [p]
 
         # Loop through subject and predicate
+        index = self.file.rdf_index()
         output = []
         for sub in s:
-            for pre in p:
-                output_new = next(self.file.rdf.objects(sub, pre, True), None)
-                if output_new != None:
-                    output.append(output_new)
+            for pre in index.predicates(p):
+                output_new = index.objects(sub, pre)
+                if len(output_new) > 0:
+                    output.append(output_new[0])
 
         # Return result
         if len(output) > 0:
@@ -123,12 +136,11 @@ class ExtractInterface:
             p = [p]
 
         # Loop through subject and predicate
+        index = self.file.rdf_index()
         output = []
         for sub in s:
-            for pre in p:
-                output_new = self.file.rdf.objects(sub, pre, True)
-                if output_new != None:
-                    output += list(output_new)
+            for pre in index.predicates(p):
+                output += index.objects(sub, pre)
 
         # Return result
         if len(output) > 0:
@@ -156,12 +168,13 @@ class ExtractInterface:
             o = [o]
 
         # Loop through predicate and object
+        index = self.file.rdf_index()
         output = []
-        for pre in p:
+        for pre in index.predicates(p):
             for obj in o:
-                output_new = next(self.file.rdf.subjects(pre, obj, True), None)
-                if output_new != None:
-                    output.append(output_new)
+                output_new = index.subjects(pre, obj)
+                if len(output_new) > 0:
+                    output.append(output_new[0])
 
         # Return result
         if len(output) > 0:
@@ -189,12 +202,11 @@ class ExtractInterface:
             o = [o]
 
         # Loop through predicate and object
+        index = self.file.rdf_index()
         output = []
-        for pre in p:
+        for pre in index.predicates(p):
             for obj in o:
-                output_new = self.file.rdf.subjects(pre, obj, True)
-                if output_new != None:
-                    output += list(output_new)
+                output += index.subjects(pre, obj)
 
         # Return result
         if len(output) > 0:
@@ -225,13 +237,14 @@ class ExtractInterface:
             o = [o]
 
         # Loop through subject, predicate, and object
+        index = self.file.rdf_index()
         output = []
         for sub in s:
-            for pre in p:
+            for pre in index.predicates(p):
                 for obj in o:
-                    output_new = next(self.file.rdf.triples((sub, pre, obj)), None)
-                    if output_new != None:
-                        output.append(output_new)
+                    output_new = index.triples(sub, pre, obj)
+                    if len(output_new) > 0:
+                        output.append(output_new[0])
 
         # Return result
         if len(output) > 0:
@@ -263,13 +276,12 @@ class ExtractInterface:
             o = [o]
 
         # Loop through subject, predicate, and object
+        index = self.file.rdf_index()
         output = []
         for sub in s:
-            for pre in p:
+            for pre in index.predicates(p):
                 for obj in o:
-                    output_new = self.file.rdf.triples((sub, pre, obj))
-                    if output_new != None:
-                        output += list(output_new)
+                    output += index.triples(sub, pre, obj)
 
         # Return result
         if count:
@@ -284,6 +296,39 @@ class ExtractInterface:
                 return None
 
 
+    def rdf_exists(self, s:list|BNode|Literal|URIRef|None, p:list|BNode|Literal|URIRef|None, o:list|BNode|Literal|URIRef|None) -> bool:
+        '''
+        Check whether any RDF triple matches, stopping at the first match
+
+            Parameters:
+                s (list|BNode|Literal|URIRef|None): Subject of the requested triple
+                p (list|BNode|Literal|URIRef|None): Predicate of the requested triple
+                o (list|BNode|Literal|URIRef|None): Object of the requested triple
+
+            Returns:
+                bool: Whether there is a matching triple
+        '''
+
+        # Unify subject, predicate, and object to lists
+        if not isinstance(s, list):
+            s = [s]
+        if not isinstance(p, list):
+            p = [p]
+        if not isinstance(o, list):
+            o = [o]
+
+        # Loop through subject, predicate, and object
+        index = self.file.rdf_index()
+        for sub in s:
+            for pre in index.predicates(p):
+                for obj in o:
+                    if index.exists(sub, pre, obj):
+                        return True
+
+        # Return result
+        return False
+
+
     def rdf_uri_label(self, uri:URIRef|BNode, p:list|BNode|Literal|URIRef) -> tuple|URIRef|Literal|None:
         '''
         Combine a URI with its labels
@@ -333,8 +378,7 @@ class ExtractInterface:
         '''
 
         # Get element
-        element_path = self.xml_paths(element_path)
-        element = self.file.xml.find(element_path)
+        element = self.xml_find(self.file.xml, element_path)
 
         # Optionally check for language code
         lang = None
@@ -343,7 +387,7 @@ class ExtractInterface:
 
         # Produce literal with language code or string
         if element != None:
-            element_string = element.xpath('normalize-space(string())')
+            element_string = self.xml_text(element)
             if no_digits and element_string.isdigit():
                 element = None
             else:
@@ -372,12 +416,13 @@ class ExtractInterface:
         '''
 
         # Get elements
-        element_paths = self.xml_paths(element_paths, True)
+        if isinstance(element_paths, str):
+            element_paths = [element_paths]
         elements = []
         for element_path in element_paths:
-            new_elements = [match for match in self.file.xml.iterfind(element_path) if match != None and match.xpath('normalize-space(string())') != '']
+            new_elements = [match for match in self.xml_findall(self.file.xml, element_path) if match != None and self.xml_text(match) != '']
             if no_digits:
-                new_elements = [match for match in new_elements if not match.xpath('normalize-space(string())').isdigit()]
+                new_elements = [match for match in new_elements if not self.xml_text(match).isdigit()]
             elements += new_elements
 
         # Go through elements
@@ -390,9 +435,9 @@ class ExtractInterface:
 
             # Replace element by literal with language code or string
             if lang:
-                elements[i] = Literal(elements[i].xpath('normalize-space(string())'), lang = lang)
+                elements[i] = Literal(self.xml_text(elements[i]), lang = lang)
             else:
-                elements[i] = elements[i].xpath('normalize-space(string())')
+                elements[i] = self.xml_text(elements[i])
 
         # Return unique results
         if elements != []:
@@ -413,8 +458,7 @@ class ExtractInterface:
         '''
 
         # Get element and return result
-        element_path = self.xml_paths(element_path)
-        return self.file.xml.find(element_path)
+        return self.xml_find(self.file.xml, element_path)
 
 
     def xml_all_elements(self, element_paths:str|list) -> list|None:
@@ -429,10 +473,11 @@ class ExtractInterface:
         '''
 
         # Get elements
-        element_paths = self.xml_paths(element_paths, True)
+        if isinstance(element_paths, str):
+            element_paths = [element_paths]
         elements = []
         for element_path in element_paths:
-            new_elements = self.file.xml.iterfind(element_path)
+            new_elements = self.xml_findall(self.file.xml, element_path)
             elements += new_elements
 
         #Return unique results
@@ -455,9 +500,8 @@ class ExtractInterface:
         '''
 
         # Get element
-        element_path = self.xml_paths(element_path)
         attribute = self.xml_paths(attribute)
-        element = self.file.xml.find(element_path)
+        element = self.xml_find(self.file.xml, element_path)
 
         # Return result
         if element != None:
@@ -482,11 +526,12 @@ class ExtractInterface:
         '''
 
         # Get elements
-        element_paths = self.xml_paths(element_paths, True)
+        if isinstance(element_paths, str):
+            element_paths = [element_paths]
         attribute = self.xml_paths(attribute)
         elements = []
         for element_path in element_paths:
-            new_elements = [match.attrib[attribute] for match in self.file.xml.iterfind(element_path) if attribute in match.attrib]
+            new_elements = [match.attrib[attribute] for match in self.xml_findall(self.file.xml, element_path) if attribute in match.attrib]
             elements += new_elements
 
         # Return unique results
@@ -513,10 +558,8 @@ class ExtractInterface:
         # Clean up paths
         if isinstance(uri, str):
             uri = [uri]
-        uri = [self.xml_paths(u) for u in uri]
         if isinstance(label, str):
             label = [label]
-        label = [self.xml_paths(l) for l in label]
 
         # Unify elements
         output = []
@@ -528,14 +571,14 @@ class ExtractInterface:
                 # Element URIs
                 element_uris = []
                 for u in uri:
-                    element_uris += [e.text for e in element.findall(u) if e.text]
+                    element_uris += [e.text for e in self.xml_findall(element, u) if e.text]
 
                 # Element label
                 element_label = None
                 for l in label:
-                    element_label = element.find(l)
+                    element_label = self.xml_find(element, l)
                 if element_label != None:
-                    element_label_text = element_label.xpath('normalize-space(string())')
+                    element_label_text = self.xml_text(element_label)
                     if element_label_text != '':
 
                         # Produce literal with language code or string
@@ -561,6 +604,26 @@ class ExtractInterface:
             return None
 
 
+    def xml_text(self, element:any) -> str:
+        '''
+        Get the text content of an XML node with normalised whitespace, computed once per node
+
+            Parameters:
+                element (any): Element of a parsed XML document
+
+            Returns:
+                str: Text content like XPath's normalize-space(string())
+        '''
+
+        # Join and normalise text if not cached yet
+        if element not in self.xml_text_cache:
+            text = ''.join(element.itertext())
+            self.xml_text_cache[element] = xml_whitespace.sub(' ', text).strip(' \t\r\n')
+
+        # Return text
+        return self.xml_text_cache[element]
+
+
     def xml_lang(self, element:any) -> str|None:
         '''
         Retrieve the language of a given XML element
@@ -569,23 +632,95 @@ class ExtractInterface:
                 element (any): Element of a parsed XML document
 
             Returns:
-                str|None: Language code of the element
+                str|None: Language code of the element, resolved once per node
         '''
 
-        # Check for language attribute
+        # Walk up until a language attribute or an already resolved ancestor is found
         lang = None
-        while lang == None and element != None:
+        visited = []
+        while element != None:
+            if element in self.xml_lang_cache:
+                lang = self.xml_lang_cache[element]
+                break
+            visited.append(element)
             if '{http://www.w3.org/XML/1998/namespace}lang' in element.attrib:
                 lang = element.attrib['{http://www.w3.org/XML/1998/namespace}lang']
+                break
 
             # Escalate inquiry to parent element
             else:
                 element = element.getparent()
 
+        # Remember the result for every element on the way
+        for element in visited:
+            self.xml_lang_cache[element] = lang
+
         # Return language code
         return lang
 
 
+    def xml_find(self, element:any, element_path:str) -> any:
+        '''
+        Get first XML node below an element matching a compiled element path
+
+            Parameters:
+                element (any): Element of a parsed XML document to start from
+                element_path (str): Element path to check, may contain namespace placeholders
+
+            Returns:
+                any: Requested element node or None
+        '''
+
+        # Evaluate compiled path
+        matches = self.xml_compile(element_path, True)(element)
+
+        # Return result
+        if len(matches) > 0:
+            return matches[0]
+        else:
+            return None
+
+
+    def xml_findall(self, element:any, element_path:str) -> list:
+        '''
+        Get all XML nodes below an element matching a compiled element path
+
+            Parameters:
+                element (any): Element of a parsed XML document to start from
+                element_path (str): Element path to check, may contain namespace placeholders
+
+            Returns:
+                list: Requested element nodes in document order
+        '''
+
+        # Evaluate compiled path and return result
+        return self.xml_compile(element_path)(element)
+
+
+    def xml_compile(self, element_path:str, first_only:bool = False) -> etree.ETXPath:
+        '''
+        Substitute namespaces in an element path and compile it once per process
+
+            Parameters:
+                element_path (str): Element path that may contain placeholders
+                first_only (bool): Whether to only select the first match
+
+            Returns:
+                etree.ETXPath: Compiled path to evaluate on elements
+        '''
+
+        # Compile path if not cached yet
+        key = (element_path, first_only)
+        if key not in xml_path_cache:
+            compiled_path = self.xml_paths(element_path)
+            if first_only:
+                compiled_path = '(' + compiled_path + ')[1]'
+            xml_path_cache[key] = etree.ETXPath(compiled_path)
+
+        # Return compiled path
+        return xml_path_cache[key]
+
+
     def xml_paths(self, element_paths:list|str, return_list:bool = False) -> str|list:
         '''
         Substitute namespace placeholders in element paths and turn input to list or string
@@ -720,15 +855,21 @@ class ExtractFeedInterface(ExtractInterface):
         self.feed_uri:Uri = Uri()
         self.feed_uri_same:UriList = UriList()
         self.feed_uri_next:Uri = Uri()
+        self.feed_uri_last:Uri = Uri()
         self.catalog_uri:Uri = Uri()
         self.catalog_uri_same:UriList = UriList()
         self.modified_date:Date = Date()
-        self.element_uris:list = []
+        self.element_uris:list|Iterator = []
+        self.element_count:int|None = None
         self.feed_elements:list = []
 
         # Inherit from interface class
         super().__init__(file)
 
+        # Count element URIs unless the feed provides an estimate
+        if self.element_count == None and isinstance(self.element_uris, list):
+            self.element_count = len(self.element_uris)
+
 
     def __bool__(self) -> bool:
         '''
@@ -753,10 +894,12 @@ class ExtractFeedInterface(ExtractInterface):
             '- feed_uri: ' + str(self.feed_uri) + '\n' +\
             '- feed_uri_same: ' + str(self.feed_uri_same) + '\n' +\
             '- feed_uri_next: ' + str(self.feed_uri_next) + '\n' +\
+            '- feed_uri_last: ' + str(self.feed_uri_last) + '\n' +\
             '- catalog_uri: ' + str(self.catalog_uri) + '\n' +\
             '- catalog_uri_same: ' + str(self.catalog_uri_same) + '\n' +\
             '- modified_date: ' + str(self.modified_date) + '\n' +\
             '- element_uris: ' + str(self.element_uris) + '\n' +\
+            '- element_count: ' + str(self.element_count) + '\n' +\
             '- feed_elements: '
 
         # Add element properties
@@ -770,7 +913,7 @@ class ExtractFeedInterface(ExtractInterface):
         return properties
 
 
-    def map(self, target:str) -> beacon.Feed|csv.Feed|cto.Feed|cto3.Feed:
+    def map(self, target:str) -> beacon.Feed|csv.Feed|cto.Feed|cto3.Feed|parquet.Feed:
         '''
         Map extracted feed data to another standard
 
@@ -778,7 +921,7 @@ class ExtractFeedInterface(ExtractInterface):
                 target (str): Identifier of the target standard to use
 
             Returns:
-                beacon.Feed|csv.Feed|cto.Feed|cto3.Feed: Feed in the target standard
+                beacon.Feed|csv.Feed|cto.Feed|cto3.Feed|parquet.Feed: Feed in the target standard
         '''
 
         # Create a feed
@@ -790,6 +933,8 @@ class ExtractFeedInterface(ExtractInterface):
             return cto.Feed(self)
         elif target == 'cto3':
             return cto3.Feed(self)
+        elif target == 'parquet':
+            return parquet.Feed(self)
         
         # Throw error for other target strings
         else:
@@ -918,7 +1063,7 @@ class ExtractFeedElementInterface(ExtractInterface):
         return properties
 
 
-    def map(self, target:str) -> beacon.FeedElement|csv.FeedElement|cto.FeedElement|cto3.FeedElement:
+    def map(self, target:str) -> beacon.FeedElement|csv.FeedElement|cto.FeedElement|cto3.FeedElement|parquet.FeedElement:
         '''
         Map extracted feed element data to another standard
 
@@ -926,7 +1071,7 @@ class ExtractFeedElementInterface(ExtractInterface):
                 target (str): Identifier of the target to use
 
             Returns:
-                beacon.FeedElement|csv.FeedElement|cto.FeedElement|cto3.FeedElement: Feed element in the target standard
+                beacon.FeedElement|csv.FeedElement|cto.FeedElement|cto3.FeedElement|parquet.FeedElement: Feed element in the target standard
         '''
 
         # Create a feed element
@@ -938,6 +1083,8 @@ class ExtractFeedElementInterface(ExtractInterface):
             return cto.FeedElement(self)
         elif target == 'cto3':
             return cto3.FeedElement(self)
+        elif target == 'parquet':
+            return parquet.FeedElement(self)
         
         # Throw error for other target strings
         else:
@@ -11,19 +11,28 @@ import codecs
 import logging
 from datetime import datetime
 from glob import glob
+from collections.abc import Iterator
+from gzip import GzipFile
 from hashlib import sha1
 from httpx import BasicAuth, Client, HTTPError
+from io import TextIOWrapper
 from lxml import etree
 from lxml.etree import ParserError as XmlParserError
 from os import linesep, makedirs, remove
 from os.path import isdir, isfile
 from PIL import Image
+from pyoxigraph import BlankNode, DefaultGraph, NamedNode, RdfFormat, Store
+from pyoxigraph import Literal as OxigraphLiteral
 from rdflib import Graph, Namespace
+from rdflib.term import BNode, Literal, URIRef
 from rdflib.exceptions import ParserError as RdfParserError
-from shutil import rmtree
+from shutil import copyfile, rmtree
 from time import sleep
-from validators import url
 from zipfile import BadZipFile, ZipFile
+from zstandard import ZstdCompressor
+
+# Import script modules
+from base.data import is_url
 
 # Define namespaces
 SCHEMA = Namespace('http://schema.org/')
@@ -31,11 +40,464 @@ SCHEMA = Namespace('http://schema.org/')
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Keep ZIP archives open while their members are read
+zip_archives:dict = {}
+
+# File extensions added by streaming compression
+compression_extensions:dict = {
+    'gzip': '.gz',
+    'zstd': '.zst'
+}
+
+# RDF formats that large files are parsed with pyoxigraph for
+oxigraph_formats:dict = {
+    'json-ld': RdfFormat.JSON_LD,
+    'n3': RdfFormat.N3,
+    'nt': RdfFormat.N_TRIPLES,
+    'turtle': RdfFormat.TURTLE,
+    'xml': RdfFormat.RDF_XML
+}
+
+
+class OxigraphGraph:
+
+
+    def __init__(self, store:Store):
+        '''
+        Provide the rdflib graph calls used during extraction on top of a pyoxigraph store
+
+            Parameters:
+                store (Store): Store holding the triples in its default graph
+        '''
+
+        # Vars
+        self.store:Store = store
+
+
+    def __len__(self) -> int:
+        '''
+        Count triples in the graph
+
+            Returns:
+                int: Number of triples
+        '''
+
+        # Return number of triples
+        return len(self.store)
+
+
+    def __iter__(self) -> Iterator:
+        '''
+        Iterate over all triples in the graph
+
+            Returns:
+                Iterator: rdflib triples
+        '''
+
+        # Return all triples
+        return self.triples((None, None, None))
+
+
+    def __contains__(self, triple:tuple) -> bool:
+        '''
+        Check whether a triple pattern has any match
+
+            Parameters:
+                triple (tuple): Subject, predicate, and object, None for any
+
+            Returns:
+                bool: Whether the pattern matches
+        '''
+
+        # Look for a first match
+        return next(self.triples(triple), None) != None
+
+
+    def triples(self, triple:tuple) -> Iterator:
+        '''
+        Get all triples matching a pattern
+
+            Parameters:
+                triple (tuple): Subject, predicate, and object, None for any
+
+            Returns:
+                Iterator: rdflib triples
+        '''
+
+        # Convert pattern, which cannot match if a term is not valid in its position
+        try:
+            s, p, o = [to_oxigraph(term) for term in triple]
+            quads = self.store.quads_for_pattern(s, p, o, DefaultGraph())
+        except (TypeError, ValueError):
+            return
+
+        # Convert matches
+        for quad in quads:
+            yield (to_rdflib(quad.subject), to_rdflib(quad.predicate), to_rdflib(quad.object))
+
+
+    def objects(self, subject:BNode|Literal|URIRef|None = None, predicate:BNode|Literal|URIRef|None = None, unique:bool = False) -> Iterator:
+        '''
+        Get objects of matching triples
+
+            Parameters:
+                subject (BNode|Literal|URIRef|None): Subject to match, None for any
+                predicate (BNode|Literal|URIRef|None): Predicate to match, None for any
+                unique (bool): Whether to skip duplicate objects
+
+            Returns:
+                Iterator: Objects of the triples
+        '''
+
+        # Return objects, only once if requested
+        if unique:
+            return iter(dict.fromkeys([o for s, p, o in self.triples((subject, predicate, None))]))
+        else:
+            return (o for s, p, o in self.triples((subject, predicate, None)))
+
+
+    def subjects(self, predicate:BNode|Literal|URIRef|None = None, object:BNode|Literal|URIRef|None = None, unique:bool = False) -> Iterator:
+        '''
+        Get subjects of matching triples
+
+            Parameters:
+                predicate (BNode|Literal|URIRef|None): Predicate to match, None for any
+                object (BNode|Literal|URIRef|None): Object to match, None for any
+                unique (bool): Whether to skip duplicate subjects
+
+            Returns:
+                Iterator: Subjects of the triples
+        '''
+
+        # Return subjects, only once if requested
+        if unique:
+            return iter(dict.fromkeys([s for s, p, o in self.triples((None, predicate, object))]))
+        else:
+            return (s for s, p, o in self.triples((None, predicate, object)))
+
+
+    def predicate_objects(self, subject:BNode|Literal|URIRef) -> Iterator:
+        '''
+        Get predicates and objects of a subject
+
+            Parameters:
+                subject (BNode|Literal|URIRef): Subject to match
+
+            Returns:
+                Iterator: Tuples of predicate and object
+        '''
+
+        # Return pairs
+        return ((p, o) for s, p, o in self.triples((subject, None, None)))
+
+
+    def subject_predicates(self, object:BNode|Literal|URIRef) -> Iterator:
+        '''
+        Get subjects and predicates of an object
+
+            Parameters:
+                object (BNode|Literal|URIRef): Object to match
+
+            Returns:
+                Iterator: Tuples of subject and predicate
+        '''
+
+        # Return pairs
+        return ((s, p) for s, p, o in self.triples((None, None, object)))
+
+
+    def serialize(self, destination:str, format:str = 'turtle', encoding:str = 'utf-8'):
+        '''
+        Save the triples to a file
+
+            Parameters:
+                destination (str): Path of the file to create
+                format (str): rdflib name of the RDF format
+                encoding (str): Encoding of the file, pyoxigraph always uses UTF-8
+        '''
+
+        # Save using pyoxigraph
+        if format in oxigraph_formats:
+            self.store.dump(output = destination, format = oxigraph_formats[format], from_graph = DefaultGraph(), prefixes = {'schema': str(SCHEMA)})
+
+        # Save using rdflib for other formats
+        else:
+            rdf = Graph()
+            rdf.bind('schema', SCHEMA, replace = True) # "Replace" overrides the RDFLib schema namespace (SDO), which uses "https"
+            for triple in self:
+                rdf.add(triple)
+            rdf.serialize(destination = destination, format = format, encoding = encoding)
+
+
+class RdfIndex:
+
+
+    def __init__(self, rdf:Graph|OxigraphGraph, descriptions:dict|None = None):
+        '''
+        Index triples by subject and by object, with schema.org predicates unified to "http"
+
+            Parameters:
+                rdf (Graph|OxigraphGraph): Parsed RDF graph to index
+                descriptions (dict|None): Subject descriptions to limit the index to a slice of the graph
+        '''
+
+        # Vars
+        self.rdf:Graph|OxigraphGraph = rdf
+        self.by_subject:dict = {}
+        self.by_object:dict = {}
+        self.complete:bool = False
+        self.cache:dict = {}
+
+        # Index a slice completely instead of reading the graph on demand
+        if descriptions != None:
+            self.by_subject = descriptions
+            for sub, index in descriptions.items():
+                for pre, objs in index.items():
+                    for obj in objs:
+                        self.by_object.setdefault(obj, {}).setdefault(pre, {})[sub] = None
+            self.complete = True
+
+
+    def predicates(self, p:list) -> list:
+        '''
+        Unify a list of predicates and remove duplicates
+
+            Parameters:
+                p (list): Predicates to unify
+
+            Returns:
+                list: Unified predicates in their original order
+        '''
+
+        # Return unique unified predicates
+        return list(dict.fromkeys([unify_predicate(pre) for pre in p]))
+
+
+    def subject_index(self, s:BNode|Literal|URIRef) -> dict:
+        '''
+        Get the predicates and objects of a subject, reading them from the graph only once
+
+            Parameters:
+                s (BNode|Literal|URIRef): Subject to look up
+
+            Returns:
+                dict: Unified predicates with ordered dicts of objects
+        '''
+
+        # Read subject from graph if not indexed yet
+        if s not in self.by_subject:
+            if self.complete:
+                return {}
+            index = {}
+            for pre, obj in self.rdf.predicate_objects(s):
+                index.setdefault(unify_predicate(pre), {})[obj] = None
+            self.by_subject[s] = index
+
+        # Return index
+        return self.by_subject[s]
+
+
+    def object_index(self, o:BNode|Literal|URIRef) -> dict:
+        '''
+        Get the subjects and predicates of an object, reading them from the graph only once
+
+            Parameters:
+                o (BNode|Literal|URIRef): Object to look up
+
+            Returns:
+                dict: Unified predicates with ordered dicts of subjects
+        '''
+
+        # Read object from graph if not indexed yet
+        if o not in self.by_object:
+            if self.complete:
+                return {}
+            index = {}
+            for sub, pre in self.rdf.subject_predicates(o):
+                index.setdefault(unify_predicate(pre), {})[sub] = None
+            self.by_object[o] = index
+
+        # Return index
+        return self.by_object[o]
+
+
+    def describe(self, node:BNode|URIRef, skip:set, named:bool = False) -> dict:
+        '''
+        Collect the concise bounded description of a node, i.e. its triples and those of its blank nodes
+
+            Parameters:
+                node (BNode|URIRef): Node to describe
+                skip (set): Nodes not to follow when they are reached as objects
+                named (bool): Whether to also describe named objects one level down
+
+            Returns:
+                dict: Subjects with unified predicates and ordered dicts of objects
+        '''
+
+        # Walk through blank nodes and, if requested, the first level of named nodes
+        output = {}
+        pending = [(node, named)]
+        while len(pending) > 0:
+            node, named = pending.pop()
+            if node not in output:
+                output[node] = self.subject_index(node)
+                for objs in output[node].values():
+                    for obj in objs:
+                        if obj in skip:
+
+                            # Keep the triples of a skipped named node, e.g. the name of another element, without following it
+                            if named and isinstance(obj, URIRef) and obj not in output:
+                                output[obj] = self.subject_index(obj)
+                        elif isinstance(obj, BNode):
+                            pending.append((obj, named))
+                        elif named and isinstance(obj, URIRef):
+                            pending.append((obj, False))
+
+        # Return descriptions
+        return output
+
+
+    def objects(self, s:BNode|Literal|URIRef|None, p:BNode|Literal|URIRef|None) -> list:
+        '''
+        Get the unique objects of matching triples
+
+            Parameters:
+                s (BNode|Literal|URIRef|None): Subject of the requested triples, None for any
+                p (BNode|Literal|URIRef|None): Predicate of the requested triples, None for any
+
+            Returns:
+                list: Objects of the requested triples
+        '''
+
+        # Use the subject index if possible
+        if s != None and p != None:
+            return list(self.subject_index(s).get(unify_predicate(p), {}))
+        else:
+            return list(dict.fromkeys([obj for sub, pre, obj in self.triples(s, p, None)]))
+
+
+    def subjects(self, p:BNode|Literal|URIRef|None, o:BNode|Literal|URIRef|None) -> list:
+        '''
+        Get the unique subjects of matching triples
+
+            Parameters:
+                p (BNode|Literal|URIRef|None): Predicate of the requested triples, None for any
+                o (BNode|Literal|URIRef|None): Object of the requested triples, None for any
+
+            Returns:
+                list: Subjects of the requested triples
+        '''
+
+        # Use the object index if possible
+        if o != None and p != None:
+            return list(self.object_index(o).get(unify_predicate(p), {}))
+        else:
+            return list(dict.fromkeys([sub for sub, pre, obj in self.triples(None, p, o)]))
+
+
+    def exists(self, s:BNode|Literal|URIRef|None, p:BNode|Literal|URIRef|None, o:BNode|Literal|URIRef|None) -> bool:
+        '''
+        Check whether any triple matches, stopping at the first match
+
+            Parameters:
+                s (BNode|Literal|URIRef|None): Subject of the requested triple, None for any
+                p (BNode|Literal|URIRef|None): Predicate of the requested triple, None for any
+                o (BNode|Literal|URIRef|None): Object of the requested triple, None for any
+
+            Returns:
+                bool: Whether there is a match
+        '''
+
+        # Unify predicate
+        if p != None:
+            p = unify_predicate(p)
+
+        # Subject given
+        if s != None:
+            for pre, objs in self.subject_index(s).items():
+                if p == None or pre == p:
+                    if o == None or o in objs:
+                        return True
+
+        # Object given
+        elif o != None:
+            for pre, subs in self.object_index(o).items():
+                if p == None or pre == p:
+                    return True
+
+        # Neither given, so check the whole slice
+        elif self.complete:
+            for index in self.by_subject.values():
+                if p == None or p in index:
+                    return True
+
+        # Neither given, so check the whole graph
+        else:
+            for sub, pre, obj in self.rdf:
+                if p == None or unify_predicate(pre) == p:
+                    return True
+
+        # Return result
+        return False
+
+
+    def triples(self, s:BNode|Literal|URIRef|None, p:BNode|Literal|URIRef|None, o:BNode|Literal|URIRef|None) -> list:
+        '''
+        Get matching triples, using unified predicates
+
+            Parameters:
+                s (BNode|Literal|URIRef|None): Subject of the requested triples, None for any
+                p (BNode|Literal|URIRef|None): Predicate of the requested triples, None for any
+                o (BNode|Literal|URIRef|None): Object of the requested triples, None for any
+
+            Returns:
+                list: Requested triples
+        '''
+
+        # Unify predicate
+        if p != None:
+            p = unify_predicate(p)
+
+        # Subject given
+        output = []
+        if s != None:
+            for pre, objs in self.subject_index(s).items():
+                if p == None or pre == p:
+                    for obj in objs:
+                        if o == None or obj == o:
+                            output.append((s, pre, obj))
+
+        # Object given
+        elif o != None:
+            for pre, subs in self.object_index(o).items():
+                if p == None or pre == p:
+                    for sub in subs:
+                        output.append((sub, pre, o))
+
+        # Neither given, so check the whole slice
+        elif self.complete:
+            for sub, index in self.by_subject.items():
+                for pre, objs in index.items():
+                    if p == None or pre == p:
+                        for obj in objs:
+                            output.append((sub, pre, obj))
+
+        # Neither given, so check the whole graph
+        else:
+            for sub, pre, obj in self.rdf:
+                pre = unify_predicate(pre)
+                if p == None or pre == p:
+                    output.append((sub, pre, obj))
+            output = list(dict.fromkeys(output))
+
+        # Return result
+        return output
+
 
 class File:
 
 
-    def __init__(self, location:str, content_type:str|None = None, ba_username:str|None = None, ba_password:str|None = None, user_agent:str = 'Hydra Scraper/0.9.6', ):
+    def __init__(self, location:str, content_type:str|None = None, ba_username:str|None = None, ba_password:str|None = None, user_agent:str = 'Hydra Scraper/0.9.6', stream:bool = False):
         '''
         Retrieve remote or local files
 
@@ -45,20 +507,25 @@ class File:
                 ba_username (str): Basic Auth username for requests
                 ba_password (str): Basic Auth password for requests
                 user_agent (str): User agent to use in remote file requests
+                stream (bool): Whether to keep plain-text content on disk and read it line by line
         '''
 
         # Vars
         self.success:bool = False
         self.unpack:str = 'unpack'
+        self.stream:bool = stream
 
         # Content vars
         self.location:str = location
         self.ba_username:str|None = ba_username
         self.ba_password:str|None = ba_password
         self.text:str|None = None
+        self.text_path:str|None = None
+        self.text_encoding:str|None = None
         self.directory:list|None = None
         self.directory_path:str|None = None
-        self.rdf:Graph|None = None
+        self.rdf:Graph|OxigraphGraph|None = None
+        self.index:RdfIndex|None = None
         self.xml:etree|None = None
         self.content_type:str|None = content_type
         self.file_type:str|None = None
@@ -67,12 +534,14 @@ class File:
         self.request_time:datetime|None = None
 
         # Remote, local, or folder routine
-        if url(self.location):
+        if is_url(self.location):
             self.remote_file()
         elif isfile(self.location):
             self.local_file()
         elif isdir(self.location):
             self.local_folder()
+        elif zip_member(self.location):
+            self.local_file()
         else:
             logger.error('Location ' + self.location + ' is neither a URL nor a local path nor a folder')
 
@@ -110,8 +579,7 @@ class File:
                     logger.info('Waiting for ' + str(timer) + ' seconds for the server to recover')
 
                 # Request response from URL
-                with Client(headers = headers, auth = auth, timeout = 10800.0, follow_redirects = True) as client:
-                    r = client.get(self.location)
+                with Client(headers = headers, auth = auth, timeout = 10800.0, follow_redirects = True) as client, client.stream('GET', self.location) as r:
 
                     # Check if response is valid
                     if r.status_code == 200:
@@ -191,7 +659,14 @@ class File:
                             logger.warning('Could not recognise file type of ' + self.location)
 
                         # Store content
-                        if not self.file_extension == 'zip':
+                        if self.stream and self.file_type == 'txt':
+                            self.text_path = self.unpack + '/payload.txt'
+                            self.text_encoding = r.encoding
+                            with open(self.text_path, 'wb') as f:
+                                for chunk in r.iter_bytes():
+                                    f.write(chunk)
+                        elif not self.file_extension == 'zip':
+                            r.read()
                             self.text = r.text
                             self.parse_content()
 
@@ -199,10 +674,9 @@ class File:
                         else:
                             zip = self.unpack + '/payload.zip'
                             with open(zip, 'wb') as f:
-                                f.write(r.content)
-                            unpack_zip(zip, self.unpack)
-                            remove(zip)
-                            self.local_folder(self.unpack)
+                                for chunk in r.iter_bytes():
+                                    f.write(chunk)
+                            self.local_zip(zip)
 
                         # Prevent further attempts in case of successful retrieval
                         break
@@ -228,9 +702,9 @@ class File:
         Retrieve local file and store content
         '''
 
-        # Retrieve file content
+        # Retrieve file content, also from within a ZIP archive
         try:
-            with open(self.location) as f:
+            with open_file(self.location) as f:
                 self.success = True
                 logger.info('Fetched local file ' + self.location)
 
@@ -291,17 +765,18 @@ class File:
                     self.directory_path = self.location[:directory_path_index]
 
                 # Store content
-                if not self.file_extension == 'zip':
+                if self.stream and self.file_type == 'txt' and isfile(self.location):
+                    self.text_path = self.location
+                elif not self.file_extension == 'zip':
                     self.text = f.read()
                     self.parse_content()
 
                 # Handle ZIP file
                 else:
-                    unpack_zip(self.location, self.unpack)
-                    self.local_folder(self.unpack)
+                    self.local_zip()
 
         # Log info
-        except OSError:
+        except (OSError, KeyError, BadZipFile):
             logger.error('Could not fetch local file ' + self.location)
 
 
@@ -332,6 +807,53 @@ class File:
             logger.error('Empty local folder ' + location)
 
 
+    def local_zip(self, location:str|None = None):
+        '''
+        Retrieve content of a local ZIP archive without unpacking it
+        '''
+
+        if not location:
+            location = self.location
+
+        # Retrieve archive content
+        files = files_in_zip(location)
+        if len(files) > 0:
+            self.success = True
+            logger.info('Indexed local ZIP archive ' + location)
+
+            # Set content and file type as well as file extension
+            self.content_type = 'application/zip'
+            self.file_type = 'folder'
+            self.file_extension = 'zip'
+
+            # Store file list
+            self.directory = files
+
+        # Log info
+        else:
+            logger.error('Empty local ZIP archive ' + location)
+
+
+    def lines(self):
+        '''
+        Read content line by line, directly from disk if it was streamed
+
+            Returns:
+                generator: Lines of the content without line breaks
+        '''
+
+        # Read streamed content from disk
+        if self.text_path:
+            with open(self.text_path, encoding = self.text_encoding) as f:
+                for line in f:
+                    yield line.rstrip('\r\n')
+
+        # Read stored content
+        elif self.text != None:
+            for line in self.text.splitlines():
+                yield line
+
+
     def parse_content(self):
         '''
         Parse content as RDF or XML
@@ -348,9 +870,16 @@ class File:
         # Parse as RDF
         if self.file_type in ['rdfa', 'xml', 'n3', 'turtle', 'trig', 'trix', 'nquads', 'json-ld', 'hext', 'nt']:
             try:
-                self.rdf = Graph()
-                self.rdf.bind('schema', SCHEMA, replace = True) # "Replace" overrides the RDFLib schema namespace (SDO), which uses "https"
-                self.rdf.parse(data = self.text.encode(), format = self.file_type)
+
+                # Parse using pyoxigraph (quick, falls back to rdflib if the content needs more leniency)
+                if len(self.text) >= 1000000 and self.file_type in oxigraph_formats: # 1 MB
+                    self.rdf = parse_oxigraph(self.text, self.file_type)
+
+                # Parse using rdflib (slow and complete, hogs more memory)
+                if self.rdf == None:
+                    self.rdf = Graph()
+                    self.rdf.bind('schema', SCHEMA, replace = True) # "Replace" overrides the RDFLib schema namespace (SDO), which uses "https"
+                    self.rdf.parse(data = self.text.encode(), format = self.file_type)
 
             # Parse as XML instead (nested because RDF may be XML)
             except RdfParserError:
@@ -399,9 +928,12 @@ class File:
         if self.success:
             if not format:
                 file_path = file_path + '.' + self.file_extension
-                f = open(file_path, 'w')
-                f.write(self.text)
-                f.flush
+                if self.text_path:
+                    copyfile(self.text_path, file_path)
+                else:
+                    f = open(file_path, 'w')
+                    f.write(self.text)
+                    f.flush
                 logger.info('Saved content to file ' + file_path)
 
             # Serialise RDF content
@@ -474,6 +1006,22 @@ class File:
         self.save(file_path, 'json-ld')
 
 
+    def rdf_index(self) -> RdfIndex|None:
+        '''
+        Provide an index of the parsed RDF graph, set up once per file
+
+            Returns:
+                RdfIndex|None: Index to query triples with
+        '''
+
+        # Set up index on first use
+        if self.index == None and self.rdf != None:
+            self.index = RdfIndex(self.rdf)
+
+        # Return index
+        return self.index
+
+
 class MediaFile:
 
 
@@ -506,7 +1054,7 @@ class MediaFile:
         self.file_name = sha1(element_uri.encode()).hexdigest()
 
         # Download file if it does not exist yet
-        if url(self.location):
+        if is_url(self.location):
             if not glob(self.directory + '/' + self.file_name + '.*'):
                 self.remote_file()
             else:
@@ -693,23 +1241,231 @@ def strip_string(input:str) -> str:
     return input
 
 
-def unpack_zip(file_path:str, folder_path:str):
+def parse_oxigraph(text:str, file_type:str) -> OxigraphGraph|None:
     '''
-    Unpack a ZIP archive to a local folder
+    Parse RDF content into a new in-memory pyoxigraph store
 
         Parameters:
-            file_path (str): Path to the ZIP archive to unpack
-            folder_path (str): Path to the folder to unpack the archive in
+            text (str): Content to parse
+            file_type (str): rdflib name of the RDF format
+
+        Returns:
+            OxigraphGraph|None: Graph or None if the content could not be parsed
     '''
 
+    # Load content into default graph
+    store = Store()
     try:
-        with ZipFile(file_path, 'r') as zip:
-            zip.extractall(folder_path)
-        logger.info('Unpacked ZIP archive ' + file_path)
+        store.load(input = text.encode(), format = oxigraph_formats[file_type], to_graph = DefaultGraph())
+    except (SyntaxError, ValueError):
+        logger.info('Could not parse content with pyoxigraph, falling back to rdflib')
+        return None
+
+    # Return graph
+    return OxigraphGraph(store)
+
+
+def to_oxigraph(term:BNode|Literal|URIRef|None) -> BlankNode|OxigraphLiteral|NamedNode|None:
+    '''
+    Convert an rdflib term to its pyoxigraph counterpart
+
+        Parameters:
+            term (BNode|Literal|URIRef|None): Term to convert
+
+        Returns:
+            BlankNode|OxigraphLiteral|NamedNode|None: Converted term
+    '''
+
+    # Convert by type
+    if isinstance(term, URIRef):
+        return NamedNode(str(term))
+    elif isinstance(term, BNode):
+        return BlankNode(str(term))
+    elif isinstance(term, Literal):
+        if term.language:
+            return OxigraphLiteral(str(term), language = term.language)
+        elif term.datatype:
+            return OxigraphLiteral(str(term), datatype = NamedNode(str(term.datatype)))
+        else:
+            return OxigraphLiteral(str(term))
+    else:
+        return term
+
+
+def to_rdflib(term:BlankNode|OxigraphLiteral|NamedNode) -> BNode|Literal|URIRef:
+    '''
+    Convert a pyoxigraph term to its rdflib counterpart
 
-    # Log info
-    except BadZipFile:
-        logger.error('Failed to unpack ZIP archive ' + file_path)
+        Parameters:
+            term (BlankNode|OxigraphLiteral|NamedNode): Term to convert
+
+        Returns:
+            BNode|Literal|URIRef: Converted term
+    '''
+
+    # Convert by type, leaving plain strings without a datatype like rdflib does
+    if isinstance(term, NamedNode):
+        return URIRef(term.value)
+    elif isinstance(term, BlankNode):
+        return BNode(term.value)
+    elif term.language:
+        return Literal(term.value, lang = term.language)
+    elif term.datatype.value == 'http://www.w3.org/2001/XMLSchema#string':
+        return Literal(term.value)
+    else:
+        return Literal(term.value, datatype = URIRef(term.datatype.value))
+
+
+def unify_predicate(predicate:BNode|Literal|URIRef) -> BNode|Literal|URIRef:
+    '''
+    Replace the "https" schema.org namespace with the "http" one used throughout the scraper
+
+        Parameters:
+            predicate (BNode|Literal|URIRef): Predicate to unify
+
+        Returns:
+            BNode|Literal|URIRef: Unified predicate
+    '''
+
+    # Swap namespace if necessary
+    if isinstance(predicate, URIRef) and predicate.startswith('https://schema.org/'):
+        predicate = SCHEMA[predicate[19:]]
+
+    # Return predicate
+    return predicate
+
+
+def open_zip(file_path:str) -> ZipFile|None:
+    '''
+    Open a ZIP archive once and keep it open for further reads
+
+        Parameters:
+            file_path (str): Path to the ZIP archive to open
+
+        Returns:
+            ZipFile|None: Open archive or None if it is not a ZIP archive
+    '''
+
+    # Open archive if it was not opened before
+    if file_path not in zip_archives:
+        try:
+            zip_archives[file_path] = ZipFile(file_path, 'r')
+        except (OSError, BadZipFile):
+            logger.error('Failed to open ZIP archive ' + file_path)
+            return None
+
+    # Return open archive
+    return zip_archives[file_path]
+
+
+def close_zips():
+    '''
+    Close all ZIP archives opened to read their members
+    '''
+
+    # Close and forget each archive
+    for zip in zip_archives.values():
+        zip.close()
+    zip_archives.clear()
+
+
+def zip_member(location:str) -> tuple|None:
+    '''
+    Split a path like "archive.zip/folder/file.xml" into archive and member
+
+        Parameters:
+            location (str): Path that may point to a file within a ZIP archive
+
+        Returns:
+            tuple|None: Path of the archive and name of the member, or None
+    '''
+
+    # Find archive part of the path
+    index = location.lower().find('.zip/')
+    if index != -1:
+        file_path = location[:index + 4]
+        if isfile(file_path):
+            return file_path, location[index + 5:]
+
+    # Return nothing if there is no archive
+    return None
+
+
+def open_file(location:str) -> TextIOWrapper:
+    '''
+    Open a local file for reading, also if it is a member of a ZIP archive
+
+        Parameters:
+            location (str): Local path of the file, may include a ZIP archive
+
+        Returns:
+            TextIOWrapper: Text stream to read the file from
+    '''
+
+    # Read regular files directly
+    if isfile(location):
+        return open(location)
+
+    # Stream ZIP members from the archive
+    member = zip_member(location)
+    if member:
+        zip = open_zip(member[0])
+        if zip:
+            return TextIOWrapper(zip.open(member[1]))
+    raise FileNotFoundError(location)
+
+
+def open_compressed(file_path:str, compress:str|None = None, level:int|None = None) -> any:
+    '''
+    Open a local file for writing bytes, optionally through streaming compression
+
+        Parameters:
+            file_path (str): Path of the file to create, without compression extension
+            compress (str|None): Compression to use, 'gzip' or 'zstd'
+            level (int|None): Compression level, library default if not set
+
+        Returns:
+            any: Binary stream to write the file to
+    '''
+
+    # Write uncompressed files directly
+    if compress == None:
+        return open(file_path, 'wb')
+
+    # Compress in chunks while writing
+    file_path += compression_extensions[compress]
+    if compress == 'gzip':
+        if level == None:
+            level = 6
+        return GzipFile(file_path, 'wb', compresslevel = level)
+    elif compress == 'zstd':
+        if level == None:
+            level = 3
+        return ZstdCompressor(level = level).stream_writer(open(file_path, 'wb'))
+    else:
+        raise ValueError('Hydra Scraper called with an invalid compression.')
+
+
+def files_in_zip(file_path:str) -> list:
+    '''
+    Read a local ZIP archive and return a list of member paths
+
+        Parameters:
+            file_path (str): Path to the ZIP archive to read
+    '''
+
+    # Prepare list
+    entries = []
+
+    # Add each file in the archive to list, leaving out folders
+    zip = open_zip(file_path)
+    if zip:
+        for info in zip.infolist():
+            if not info.is_dir():
+                entries.append(file_path + '/' + info.filename)
+
+    # Return entries
+    return entries
 
 
 def files_in_folder(folder_path:str) -> list:
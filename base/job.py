@@ -8,10 +8,17 @@
 
 # Import libraries
 import logging
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from os.path import getsize
+from multiprocessing import Manager
+from io import TextIOWrapper
+from os.path import getsize, isdir
+from re import split
 from pyoxigraph import DefaultGraph, RdfFormat, Store
 from rdflib import Graph, Namespace
+from threading import Lock
 
 # Import script modules
 import extract.beacon as beacon
@@ -19,9 +26,11 @@ import extract.cmif as cmif
 import extract.folder as folder
 import extract.lido as lido
 import extract.schema as schema
-from base.data import Uri, UriList
-from base.file import MediaFile, File, files_in_folder, remove_folder
+import map.parquet as parquet
+from base.data import Uri, UriList, is_url
+from base.file import MediaFile, File, close_zips, compression_extensions, files_in_folder, open_compressed, remove_folder
 from base.lookup import Lookup
+from base.map import OxigraphStore, ntriples_row
 from base.organise import Organise, delay_request
 
 # Define namespaces
@@ -30,6 +39,9 @@ SCHEMA = Namespace('http://schema.org/')
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Configuration and look-up store of a worker process
+worker:dict = {}
+
 
 class Job:
 
@@ -48,6 +60,19 @@ class Job:
         self.organise:Organise = organise
         self.lookup:Lookup = Lookup(self.organise.folder + '/lookup')
         self.last_request:datetime|None = None
+        self.request_lock:Lock = Lock()
+        self.table:parquet.Table|None = None
+        self.store:OxigraphStore|None = None
+
+        # Stream Parquet rows into one file in row groups
+        if 'parquet' in self.organise.output:
+            self.table = parquet.Table(self.organise.folder + '/table.parquet', compression = self.organise.compress, compression_level = self.organise.compress_level)
+
+        # Bulk-load nfdicore/cto v3 triples into a fresh store
+        if 'store' in self.organise.output:
+            if isdir(self.organise.folder + '/store'):
+                remove_folder(self.organise.folder + '/store')
+            self.store = OxigraphStore(self.organise.folder + '/store')
 
         # Set up reporting
         if not self.organise.quiet:
@@ -56,36 +81,16 @@ class Job:
         status_feed = 'Entire feed processed.'
         status_elements = 'All feed elements processed.'
 
-        # Enter feed pagination loop
-        feed_uri = self.organise.location
+        # Enter feed pagination loop, the next page being retrieved in the background
+        pages = self.feed_pages()
         feed_index = 0
         while feed_index < self.organise.max_pagination:
             feed_index += 1
 
-            # Delay if necessary
-            if self.last_request:
-                delay_request(self.last_request, self.organise.delay)
-
-            # Get feed
+            # Get feed and extracted data
             status.done()
             status = Progress('Retrieving feed no. ' + str(feed_index) + ' and extracting data', self.organise.quiet)
-            feed_file = File(feed_uri, self.organise.dialect, ba_username = self.organise.ba_username, ba_password = self.organise.ba_password)
-            if feed_file.request_time:
-                self.last_request = feed_file.request_time
-
-            # Extract feed data
-            if self.organise.feed == 'beacon':
-                feed_data = beacon.Feed(feed_file)
-            elif self.organise.feed == 'cmif':
-                feed_data = cmif.Feed(feed_file)
-            elif self.organise.feed == 'folder':
-                feed_data = folder.Feed(feed_file)
-            elif self.organise.feed == 'schema':
-                feed_data = schema.Feed(feed_file, True)
-            elif self.organise.feed == 'schema-list':
-                feed_data = schema.Feed(feed_file)
-            else:
-                raise ValueError('Hydra Scraper called with an invalid feed type.')
+            feed_uri, feed_file, feed_data = next(pages)
 
             # Continue only when successfully retrieved
             if not feed_data.success:
@@ -110,14 +115,8 @@ class Job:
                     if self.organise.add_type:
                         element_data.element_type = Uri(self.organise.add_type)
 
-                # Alter element URIs
-                if self.organise.include:
-                    feed_data.element_uris = [element_uri for element_uri in feed_data.element_uris if self.organise.include in element_uri]
-                for index, element_uri in enumerate(feed_data.element_uris):
-                    if self.organise.replace and self.organise.replace_with:
-                        feed_data.element_uris[index] = element_uri.replace(self.organise.replace, self.organise.replace_with, 1)
-                    if self.organise.append:
-                        feed_data.element_uris[index] = element_uri + self.organise.append
+                # Alter element URIs while they are retrieved
+                feed_data.element_uris = self.alter_element_uris(feed_data.element_uris)
 
                 # Generate feed file name
                 feed_name = str(feed_index).zfill(len(str(self.organise.max_pagination)))
@@ -136,43 +135,14 @@ class Job:
                         feed_file.turtle(self.organise.folder_triples + '/' + feed_name)
 
                     # Reconcile data
-                    if 'csv' in self.organise.output or 'cto' in self.organise.output or 'cto3' in self.organise.output:
+                    if 'csv' in self.organise.output or 'cto' in self.organise.output or 'cto3' in self.organise.output or 'parquet' in self.organise.output or 'store' in self.organise.output:
                         status.done()
                         status = Progress('Reconciling authority URIs', self.organise.quiet)
                         for element_index_minus, element_data in enumerate(feed_data.feed_elements):
                             element_index = element_index_minus + 1
                             status.update(element_index, len(feed_data.feed_elements))
 
-                            # Check each vocab_further URI
-                            vocab_further = []
-                            for uri_label in element_data.vocab_further.uri_labels:
-                                if uri_label.uri.uri:
-                                    check = self.lookup.check(uri_label.uri.uri)
-                                else:
-                                    check = None
-
-                                # Add it to the right list
-                                if check == 'person':
-                                    element_data.vocab_related_person.uri_labels.append(uri_label)
-                                elif check == 'organization':
-                                    element_data.vocab_related_organization.uri_labels.append(uri_label)
-                                elif check == 'location':
-                                    element_data.vocab_related_location.uri_labels.append(uri_label)
-                                elif check == 'event':
-                                    element_data.vocab_related_event.uri_labels.append(uri_label)
-                                elif check == 'subject_concept': # Deprecated, remove along with CTO2
-                                    element_data.vocab_subject_concept.uri_labels.append(uri_label)
-                                    element_data.vocab_classifier.uri_labels.append(uri_label)
-                                elif check == 'element_type': # Deprecated, remove along with CTO2
-                                    element_data.vocab_element_type.uri_labels.append(uri_label)
-                                    element_data.vocab_classifier.uri_labels.append(uri_label)
-                                elif check == 'classifier':
-                                    element_data.vocab_classifier.uri_labels.append(uri_label)
-
-                                # Recompile vocab_further with everything else
-                                else:
-                                    vocab_further.append(uri_label)
-                            element_data.vocab_further.uri_labels = vocab_further
+                            reconcile_element(self.lookup, element_data)
 
                     # Transform data
                     if 'beacon' in self.organise.output:
@@ -187,10 +157,14 @@ class Job:
                         status.done()
                         status = Progress('Saving temporary nfdicore/cto triples', self.organise.quiet)
                         feed_data.map_and_turtle('cto', self.organise.folder_cto + '/' + feed_name, self.organise.prepare)
-                    if 'cto3' in self.organise.output:
+                    if 'cto3' in self.organise.output or 'store' in self.organise.output:
                         status.done()
-                        status = Progress('Saving temporary nfdicore/cto v3 triples', self.organise.quiet)
-                        feed_data.map_and_ntriples('cto3', self.organise.folder_cto3 + '/' + feed_name, self.organise.prepare)
+                        status = Progress('Saving nfdicore/cto v3 triples', self.organise.quiet)
+                        save_cto3(self.organise, feed_data, feed_name, self.store)
+                    if 'parquet' in self.organise.output:
+                        status.done()
+                        status = Progress('Adding rows to Parquet table', self.organise.quiet)
+                        self.table.add(table_rows(self.organise, feed_data))
 
                     # Save associated media
                     if 'media' in self.organise.output:
@@ -198,15 +172,7 @@ class Job:
                         status = Progress('Saving associated media', self.organise.quiet)
                         for element_data in feed_data.feed_elements:
                             if element_data.media:
-
-                                # Delay if necessary
-                                if self.last_request:
-                                    delay_request(self.last_request, self.organise.delay)
-
-                                # Download file
-                                media = MediaFile(element_data.media.uri.uri, self.organise.folder_media, element_data.element_uri.uri, self.organise.ba_username, self.organise.ba_password)
-                                if media.request_time:
-                                    self.last_request = media.request_time
+                                self.save_media(element_data.media.uri.uri, element_data.element_uri.uri)
 
                 # Save list without elements
                 else:
@@ -219,164 +185,115 @@ class Job:
                             feed_data.map_and_save('csv', self.organise.folder_csv + '/0', prepare = self.organise.prepare)
                         if 'cto' in self.organise.output:
                             feed_data.map_and_turtle('cto', self.organise.folder_cto + '/0', self.organise.prepare)
-                        if 'cto3' in self.organise.output:
-                            feed_data.map_and_ntriples('cto3', self.organise.folder_cto3 + '/0', self.organise.prepare)
+                        if 'cto3' in self.organise.output or 'store' in self.organise.output:
+                            save_cto3(self.organise, feed_data, '0', self.store)
 
-                    # Loop through elements
+                    # Use known or estimated number of elements for progress and file names
+                    element_count = feed_data.element_count
+                    if element_count:
+                        element_digits = len(str(element_count))
+                    else:
+                        element_digits = 1
+
+                    # Loop through elements in worker processes
                     status.done()
                     status = Progress('Retrieving feed elements and extracting data', self.organise.quiet)
-                    for element_index_minus, element_uri in enumerate(feed_data.element_uris):
-                        element_index = element_index_minus + 1
-
-                        # Delay if necessary
-                        if self.last_request:
-                            delay_request(self.last_request, self.organise.delay)
-
-                        # Get feed element
-                        status.update(element_index, len(feed_data.element_uris))
-                        element_file = File(element_uri, self.organise.dialect, ba_username = self.organise.ba_username, ba_password = self.organise.ba_password)
-                        if element_file.request_time:
-                            self.last_request = element_file.request_time
-
-                        # Generate element file name
-                        if self.organise.clean:
-                            element_name = element_uri
-                            for clean in self.organise.clean:
-                                element_name = element_name.replace(clean, '', 1)
-                            element_name = element_name.replace('/', '')
-                            element_name = element_name.replace(':', '')
-                        else:
-                            element_name = feed_name + '-' + str(element_index).zfill(len(str(len(feed_data.element_uris))))
-
-                        # Save original data
-                        if 'files' in self.organise.output:
-                            element_file.save(self.organise.folder_files + '/' + element_name)
-                        if 'triples' in self.organise.output:
-                            element_file.turtle(self.organise.folder_triples + '/' + element_name)
-
-                        # Optionally extract data
-                        if self.organise.elements:
-                            if self.organise.elements == 'lido':
-                                element_data = lido.FeedElement(element_file)
-                            elif self.organise.elements == 'schema':
-                                element_data = schema.FeedElement(element_file)
-                            else:
-                                raise ValueError('Hydra Scraper called with an invalid element markup.')
-
-                            # Continue only when successfully retrieved
-                            if not element_data.success:
-                                logger.error('Could not extract data from feed element ' + element_uri)
+                    if self.organise.workers:
+                        with Manager() as manager:
+
+                            # Share the look-up store and a lock for remote look-ups between workers
+                            keyvalue = manager.dict(self.lookup.keyvalue)
+                            with ProcessPoolExecutor(self.organise.workers, initializer = start_worker, initargs = (self.organise, keyvalue, manager.Lock())) as pool:
+                                pending = deque()
+                                for element_index_minus, element_uri in enumerate(feed_data.element_uris):
+                                    element_index = element_index_minus + 1
+                                    element_name = self.element_name(element_uri, feed_name + '-' + str(element_index).zfill(element_digits))
+                                    pending.append((element_index, pool.submit(harvest_element_worker, element_uri, element_name)))
+
+                                    # Collect results in order while keeping the queue short
+                                    if not self.collect_worker_results(pending, self.organise.workers * 4, element_count, status):
+                                        status_elements = 'At least one feed element could not be processed.'
+                                if not self.collect_worker_results(pending, 0, element_count, status):
+                                    status_elements = 'At least one feed element could not be processed.'
+
+                            # Keep look-up entries added by the workers
+                            self.lookup.keyvalue = dict(keyvalue)
+
+                    # Loop through elements one by one
+                    else:
+                        for element_index_minus, element_uri in enumerate(feed_data.element_uris):
+                            element_index = element_index_minus + 1
+
+                            # Delay if necessary
+                            self.delay(element_uri)
+
+                            # Get feed element
+                            status.update(element_index, element_count)
+                            element_file = File(element_uri, self.organise.dialect, ba_username = self.organise.ba_username, ba_password = self.organise.ba_password)
+
+                            # Save, extract, reconcile, and map element
+                            element_name = self.element_name(element_uri, feed_name + '-' + str(element_index).zfill(element_digits))
+                            element_data = harvest_element(self.organise, self.lookup, element_file, element_uri, element_name, self.store)
+                            if self.organise.elements and not element_data:
                                 status_elements = 'At least one feed element could not be processed.'
                                 self.success = False
-                            else:
-
-                                # Add data if missing
-                                if not element_data.feed_uri:
-                                    element_data.feed_uri = Uri(self.organise.location)
-                                if not element_data.element_uri:
-                                    element_data.element_uri = Uri(element_uri)
-
-                                # Alter data if requested
-                                if self.organise.add_feed:
-                                    element_data.feed_uri = Uri(self.organise.add_feed)
-                                if self.organise.add_publisher:
-                                    element_data.publisher = UriList(self.organise.add_publisher)
-                                if self.organise.add_type:
-                                    element_data.element_type = Uri(self.organise.add_type)
-
-                                # Reconcile data
-                                if 'csv' in self.organise.output or 'cto' in self.organise.output or 'cto3' in self.organise.output:
-
-                                    # Check each vocab_further URI
-                                    vocab_further = []
-                                    for uri_label in element_data.vocab_further.uri_labels:
-                                        if uri_label.uri.uri:
-                                            check = self.lookup.check(uri_label.uri.uri)
-                                        else:
-                                            check = None
-
-                                        # Add it to the right list
-                                        if check == 'person':
-                                            element_data.vocab_related_person.uri_labels.append(uri_label)
-                                        elif check == 'organization':
-                                            element_data.vocab_related_organization.uri_labels.append(uri_label)
-                                        elif check == 'location':
-                                            element_data.vocab_related_location.uri_labels.append(uri_label)
-                                        elif check == 'event':
-                                            element_data.vocab_related_event.uri_labels.append(uri_label)
-                                        elif check == 'subject_concept': # Deprecated, remove along with CTO2
-                                            element_data.vocab_subject_concept.uri_labels.append(uri_label)
-                                            element_data.vocab_classifier.uri_labels.append(uri_label)
-                                        elif check == 'element_type': # Deprecated, remove along with CTO2
-                                            element_data.vocab_element_type.uri_labels.append(uri_label)
-                                            element_data.vocab_classifier.uri_labels.append(uri_label)
-                                        elif check == 'classifier':
-                                            element_data.vocab_classifier.uri_labels.append(uri_label)
-
-                                        # Recompile vocab_further with everything else
-                                        else:
-                                            vocab_further.append(uri_label)
-                                    element_data.vocab_further.uri_labels = vocab_further
-
-                                # Transform data
-                                if 'beacon' in self.organise.output:
-                                    element_data.map_and_save('beacon', self.organise.folder_beacon + '/' + element_name, prepare = self.organise.prepare)
-                                if 'csv' in self.organise.output:
-                                    element_data.map_and_save('csv', self.organise.folder_csv + '/' + element_name, prepare = self.organise.prepare)
-                                if 'cto' in self.organise.output:
-                                    element_data.map_and_turtle('cto', self.organise.folder_cto + '/' + element_name, self.organise.prepare)
-                                if 'cto3' in self.organise.output:
-                                    element_data.map_and_ntriples('cto3', self.organise.folder_cto3 + '/' + element_name, self.organise.prepare)
-
-                                # Save associated media
-                                if 'media' in self.organise.output:
-                                    if element_data.media:
-
-                                        # Delay if necessary
-                                        if self.last_request:
-                                            delay_request(self.last_request, self.organise.delay)
-
-                                        # Download file
-                                        media = MediaFile(element_data.media.uri.uri, self.organise.folder_media, element_data.element_uri.uri, self.organise.ba_username, self.organise.ba_password)
-                                        if media.request_time:
-                                            self.last_request = media.request_time
-
-                # Set up next feed page to harvest, if available
+
+                            # Add row to Parquet table
+                            if 'parquet' in self.organise.output and element_data:
+                                self.table.add(table_rows(self.organise, element_data))
+
+                            # Save associated media
+                            if 'media' in self.organise.output and element_data:
+                                if element_data.media:
+                                    self.save_media(element_data.media.uri.uri, element_data.element_uri.uri)
+
+                # Continue with next feed page, if available
                 if feed_data.feed_uri_next:
-                    feed_uri = feed_data.feed_uri_next.uri
                     if feed_index >= self.organise.max_pagination:
                         logger.error('Maximum number of paginated feeds reached, i.e., ' + str(self.organise.max_pagination))
                 else:
                     break
 
-        # Remove content of unpack folder
+        # Stop retrieving feed pages
+        pages.close()
+
+        # Close ZIP archives and remove content of unpack folder
+        close_zips()
         remove_folder(feed_file.unpack, True)
 
         # Compile outputs, task delayed to prevent memory issues during long harvests
         if self.organise.elements and 'beacon' in self.organise.output:
             status.done()
             status = Progress('Saving compiled Beacon-like list', self.organise.quiet)
-            combine_text(self.organise.folder_beacon, self.organise.folder + '/beacon', 'txt', '#')
+            combine_text(self.organise.folder_beacon, self.organise.folder + '/beacon', 'txt', '#', self.organise.compress, self.organise.compress_level)
             remove_folder(self.organise.folder_beacon)
         if self.organise.elements and 'csv' in self.organise.output:
             status.done()
             status = Progress('Saving compiled CSV table', self.organise.quiet)
-            combine_text(self.organise.folder_csv, self.organise.folder + '/table', 'csv', '"feed_uri","element_uri","element_uri_same"')
+            combine_text(self.organise.folder_csv, self.organise.folder + '/table', 'csv', '"feed_uri","element_uri","element_uri_same"', self.organise.compress, self.organise.compress_level)
             remove_folder(self.organise.folder_csv)
         if self.organise.elements and 'cto' in self.organise.output:
             status.done()
             status = Progress('Saving compiled nfdicore/cto triples', self.organise.quiet)
-            combine_triples(self.organise.folder_cto, self.organise.folder + '/cto')
+            combine_triples(self.organise.folder_cto, self.organise.folder + '/cto', False, self.organise.compress, self.organise.compress_level)
             remove_folder(self.organise.folder_cto)
         if self.organise.elements and 'cto3' in self.organise.output:
             status.done()
             status = Progress('Saving compiled nfdicore/cto v3 triples', self.organise.quiet)
-            combine_triples(self.organise.folder_cto3, self.organise.folder + '/cto3', True)
+            combine_triples(self.organise.folder_cto3, self.organise.folder + '/cto3', True, self.organise.compress, self.organise.compress_level)
             remove_folder(self.organise.folder_cto3)
+        if self.organise.elements and 'parquet' in self.organise.output:
+            status.done()
+            status = Progress('Saving compiled Parquet table', self.organise.quiet)
+            self.table.close()
+        if self.organise.elements and 'store' in self.organise.output:
+            status.done()
+            status = Progress('Saving nfdicore/cto v3 triple store', self.organise.quiet)
+            self.store.close()
         if 'triples' in self.organise.output:
             status.done()
             status = Progress('Saving compiled triples', self.organise.quiet)
-            combine_triples(self.organise.folder_triples, self.organise.folder + '/triples')
+            combine_triples(self.organise.folder_triples, self.organise.folder + '/triples', False, self.organise.compress, self.organise.compress_level)
             remove_folder(self.organise.folder_triples)
         logger.info('Cleaned up working folder')
 
@@ -392,6 +309,226 @@ class Job:
         self.status_report()
 
 
+    def feed_pages(self) -> Iterator:
+        '''
+        Retrieve feed pages in order, starting on the next pages while the current one is processed
+
+            Returns:
+                generator: Tuples of feed URI, file, and extracted data
+        '''
+
+        # Keep one page in the background, or several if their URIs are known
+        page_workers = 1
+        if self.organise.page_workers:
+            page_workers = self.organise.page_workers
+        with ThreadPoolExecutor(page_workers) as prefetch:
+            pending = deque([(self.organise.location, prefetch.submit(self.feed_page, self.organise.location))])
+            expected = deque()
+            feed_index = 0
+            while len(pending) > 0:
+                feed_index += 1
+                feed_uri, feed_file, feed_data = pending.popleft()[1].result()
+                next_uri = None
+                if feed_data.success and feed_data.feed_uri_next:
+                    next_uri = feed_data.feed_uri_next.uri
+
+                # Derive further page URIs from the first page if requested
+                if feed_index == 1 and self.organise.page_workers and next_uri and feed_data.feed_uri_last:
+                    page_uris = page_range(next_uri, feed_data.feed_uri_last.uri, self.organise.max_pagination - 1)
+                    if page_uris:
+                        expected = deque(page_uris)
+                        logger.info('Retrieving ' + str(len(page_uris)) + ' further feed pages in parallel')
+                    else:
+                        logger.info('Could not derive feed page URIs, retrieving pages one by one')
+
+                # Check whether the page links to the page that was derived next
+                if len(pending) > 0 or len(expected) > 0:
+                    if len(pending) > 0:
+                        expected_uri = pending[0][0]
+                    else:
+                        expected_uri = expected[0]
+                    if next_uri != expected_uri:
+                        logger.info('Feed page ' + feed_uri + ' does not link to ' + expected_uri + ', retrieving pages one by one')
+                        for uri, page in pending:
+                            page.cancel()
+                        pending.clear()
+                        expected.clear()
+
+                # Queue derived pages
+                if len(pending) > 0 or len(expected) > 0:
+                    while len(pending) < page_workers and len(expected) > 0:
+                        uri = expected.popleft()
+                        pending.append((uri, prefetch.submit(self.feed_page, uri)))
+
+                # Queue next page
+                elif next_uri and feed_index < self.organise.max_pagination:
+                    pending.append((next_uri, prefetch.submit(self.feed_page, next_uri)))
+
+                # Hand over current page
+                yield feed_uri, feed_file, feed_data
+
+
+    def feed_page(self, feed_uri:str) -> tuple:
+        '''
+        Retrieve a single feed page and extract its data
+
+            Parameters:
+                feed_uri (str): URL or local path of the feed page
+
+            Returns:
+                tuple: Feed URI, file, and extracted data
+        '''
+
+        # Delay if necessary
+        self.delay(feed_uri)
+
+        # Get feed
+        feed_file = File(feed_uri, self.organise.dialect, ba_username = self.organise.ba_username, ba_password = self.organise.ba_password, stream = self.organise.feed == 'beacon')
+
+        # Extract feed data
+        if self.organise.feed == 'beacon':
+            feed_data = beacon.Feed(feed_file)
+        elif self.organise.feed == 'cmif':
+            feed_data = cmif.Feed(feed_file)
+        elif self.organise.feed == 'folder':
+            feed_data = folder.Feed(feed_file)
+        elif self.organise.feed == 'schema':
+            feed_data = schema.Feed(feed_file, True)
+        elif self.organise.feed == 'schema-list':
+            feed_data = schema.Feed(feed_file)
+        else:
+            raise ValueError('Hydra Scraper called with an invalid feed type.')
+
+        # Return result
+        return feed_uri, feed_file, feed_data
+
+
+    def delay(self, location:str):
+        '''
+        Wait for the next allowed request to a remote location, shared by all threads of a job
+
+            Parameters:
+                location (str): URL or local path that is about to be requested
+        '''
+
+        # Reserve the next request slot for remote locations only
+        if is_url(location):
+            with self.request_lock:
+                if self.last_request:
+                    delay_request(self.last_request, self.organise.delay)
+                self.last_request = datetime.now()
+
+
+    def element_name(self, element_uri:str, fallback:str) -> str:
+        '''
+        Generate the file name of a feed element
+
+            Parameters:
+                element_uri (str): URI of the feed element
+                fallback (str): Numbered name to use if URIs are not cleaned
+
+            Returns:
+                str: File name without extension
+        '''
+
+        # Clean element URI or use numbered name
+        if self.organise.clean:
+            element_name = element_uri
+            for clean in self.organise.clean:
+                element_name = element_name.replace(clean, '', 1)
+            element_name = element_name.replace('/', '')
+            element_name = element_name.replace(':', '')
+        else:
+            element_name = fallback
+
+        # Return result
+        return element_name
+
+
+    def save_media(self, location:str, element_uri:str):
+        '''
+        Download a media file associated with a feed element
+
+            Parameters:
+                location (str): URL of the media file
+                element_uri (str): URI of the feed element to form the file name
+        '''
+
+        # Delay if necessary
+        self.delay(location)
+
+        # Download file
+        MediaFile(location, self.organise.folder_media, element_uri, self.organise.ba_username, self.organise.ba_password)
+
+
+    def collect_worker_results(self, pending:deque, limit:int, element_count:int|None, status:any) -> bool:
+        '''
+        Merge results of worker processes in order until only a limited number of tasks is pending
+
+            Parameters:
+                pending (deque): Element indexes and futures of submitted tasks
+                limit (int): Number of tasks that may remain pending
+                element_count (int|None): Known or estimated number of elements
+                status (any): Progress line to update
+
+            Returns:
+                bool: Whether all collected feed elements were processed successfully
+        '''
+
+        # Wait for the oldest tasks
+        output = True
+        while len(pending) > limit:
+            element_index, future = pending.popleft()
+            success, media, rows, triples = future.result()
+            status.update(element_index, element_count)
+
+            # Note failures
+            if not success:
+                output = False
+                self.success = False
+
+            # Download media in the main process
+            if media:
+                self.save_media(media[0], media[1])
+
+            # Add rows to Parquet table and triples to store
+            if rows:
+                self.table.add(rows)
+            if triples:
+                self.store.add_ntriples(triples)
+
+        # Return result
+        return output
+
+
+    def alter_element_uris(self, element_uris:list|Iterator):
+        '''
+        Filter and rewrite feed element URIs one at a time
+
+            Parameters:
+                element_uris (list|Iterator): Feed element URIs to alter
+
+            Returns:
+                generator: Feed element URIs to retrieve
+        '''
+
+        # Go through element URIs as they come in
+        for element_uri in element_uris:
+
+            # Only keep URIs containing the include string
+            if self.organise.include and self.organise.include not in element_uri:
+                continue
+
+            # Replace and append strings
+            if self.organise.replace and self.organise.replace_with:
+                element_uri = element_uri.replace(self.organise.replace, self.organise.replace_with, 1)
+            if self.organise.append:
+                element_uri += self.organise.append
+
+            # Hand over URI
+            yield element_uri
+
+
     def status_report(self):
         '''
         Produce a final report of what happened during a scraping run
@@ -412,6 +549,272 @@ class Job:
             print('\n' + report + '\n')
 
 
+def page_range(next_uri:str, last_uri:str, limit:int) -> list|None:
+    '''
+    Derive feed page URIs from the next and the last page if they only differ in a page number
+
+        Parameters:
+            next_uri (str): URI of the next page
+            last_uri (str): URI of the last page
+            limit (int): Maximum number of URIs to return
+
+        Returns:
+            list|None: Page URIs from next to last or None if no pattern was found
+    '''
+
+    # Two pages left
+    if next_uri == last_uri:
+        return [next_uri][:limit]
+
+    # Split URIs into numbers and the parts between them
+    next_parts = split(r'(\d+)', next_uri)
+    last_parts = split(r'(\d+)', last_uri)
+    if len(next_parts) != len(last_parts):
+        return None
+
+    # Find a single differing number
+    differences = [i for i in range(len(next_parts)) if next_parts[i] != last_parts[i]]
+    if len(differences) != 1 or differences[0] % 2 == 0:
+        return None
+    position = differences[0]
+    first = int(next_parts[position])
+    last = int(last_parts[position])
+    if last < first:
+        return None
+
+    # Keep zero padding if the page numbers use it
+    width = 0
+    if len(next_parts[position]) > 1 and next_parts[position].startswith('0'):
+        width = len(next_parts[position])
+
+    # Build URIs
+    output = []
+    for number in range(first, min(last, first + limit - 1) + 1):
+        output.append(''.join(next_parts[:position]) + str(number).zfill(width) + ''.join(next_parts[position + 1:]))
+
+    # Return result
+    return output
+
+
+def harvest_element(organise:Organise, lookup:Lookup, element_file:File, element_uri:str, element_name:str, store:OxigraphStore|list|None = None) -> lido.FeedElement|schema.FeedElement|None:
+    '''
+    Save, extract, reconcile, and map a single feed element
+
+        Parameters:
+            organise (Organise): Configuration object for a single job
+            lookup (Lookup): Look-up store to reconcile authority URIs
+            element_file (File): Retrieved file of the feed element
+            element_uri (str): URI the feed element was retrieved from
+            element_name (str): File name to use for the outputs
+            store (OxigraphStore|list|None): Store to load nfdicore/cto v3 triples into, or list to collect them as NTriples rows
+
+        Returns:
+            lido.FeedElement|schema.FeedElement|None: Extracted data or None if extraction failed or was not requested
+    '''
+
+    # Save original data
+    if 'files' in organise.output:
+        element_file.save(organise.folder_files + '/' + element_name)
+    if 'triples' in organise.output:
+        element_file.turtle(organise.folder_triples + '/' + element_name)
+
+    # Optionally extract data
+    if not organise.elements:
+        return None
+    elif organise.elements == 'lido':
+        element_data = lido.FeedElement(element_file)
+    elif organise.elements == 'schema':
+        element_data = schema.FeedElement(element_file)
+    else:
+        raise ValueError('Hydra Scraper called with an invalid element markup.')
+
+    # Continue only when successfully retrieved
+    if not element_data.success:
+        logger.error('Could not extract data from feed element ' + element_uri)
+        return None
+
+    # Add data if missing
+    if not element_data.feed_uri:
+        element_data.feed_uri = Uri(organise.location)
+    if not element_data.element_uri:
+        element_data.element_uri = Uri(element_uri)
+
+    # Alter data if requested
+    if organise.add_feed:
+        element_data.feed_uri = Uri(organise.add_feed)
+    if organise.add_publisher:
+        element_data.publisher = UriList(organise.add_publisher)
+    if organise.add_type:
+        element_data.element_type = Uri(organise.add_type)
+
+    # Reconcile data
+    if 'csv' in organise.output or 'cto' in organise.output or 'cto3' in organise.output or 'parquet' in organise.output or 'store' in organise.output:
+        reconcile_element(lookup, element_data)
+
+    # Transform data
+    if 'beacon' in organise.output:
+        element_data.map_and_save('beacon', organise.folder_beacon + '/' + element_name, prepare = organise.prepare)
+    if 'csv' in organise.output:
+        element_data.map_and_save('csv', organise.folder_csv + '/' + element_name, prepare = organise.prepare)
+    if 'cto' in organise.output:
+        element_data.map_and_turtle('cto', organise.folder_cto + '/' + element_name, organise.prepare)
+    if 'cto3' in organise.output or 'store' in organise.output:
+        save_cto3(organise, element_data, element_name, store)
+
+    # Return extracted data
+    return element_data
+
+
+def reconcile_element(lookup:Lookup, element_data:lido.FeedElement|schema.FeedElement):
+    '''
+    Sort further vocabulary URIs of a feed element into more specific lists
+
+        Parameters:
+            lookup (Lookup): Look-up store to reconcile authority URIs
+            element_data (lido.FeedElement|schema.FeedElement): Extracted data to reconcile
+    '''
+
+    # Check each vocab_further URI
+    vocab_further = []
+    for uri_label in element_data.vocab_further.uri_labels:
+        if uri_label.uri.uri:
+            check = lookup.check(uri_label.uri.uri)
+        else:
+            check = None
+
+        # Add it to the right list
+        if check == 'person':
+            element_data.vocab_related_person.add(uri_label)
+        elif check == 'organization':
+            element_data.vocab_related_organization.add(uri_label)
+        elif check == 'location':
+            element_data.vocab_related_location.add(uri_label)
+        elif check == 'event':
+            element_data.vocab_related_event.add(uri_label)
+        elif check == 'subject_concept': # Deprecated, remove along with CTO2
+            element_data.vocab_subject_concept.add(uri_label)
+            element_data.vocab_classifier.add(uri_label)
+        elif check == 'element_type': # Deprecated, remove along with CTO2
+            element_data.vocab_element_type.add(uri_label)
+            element_data.vocab_classifier.add(uri_label)
+        elif check == 'classifier':
+            element_data.vocab_classifier.add(uri_label)
+
+        # Recompile vocab_further with everything else
+        else:
+            vocab_further.append(uri_label)
+    element_data.vocab_further.uri_labels = vocab_further
+
+
+def table_rows(organise:Organise, data:any) -> list:
+    '''
+    Map a feed or feed element to rows of the Parquet table
+
+        Parameters:
+            organise (Organise): Configuration object for a single job
+            data (any): Extracted data of a feed or feed element
+
+        Returns:
+            list: Rows as dictionaries keyed by column name
+    '''
+
+    # Generate rows
+    mapped = data.map('parquet')
+    mapped.generate(organise.prepare)
+
+    # Return rows
+    return mapped.rows
+
+
+def save_cto3(organise:Organise, data:any, name:str, store:OxigraphStore|list|None = None):
+    '''
+    Map a feed or feed element to nfdicore/cto v3 triples once and hand them to all requested outputs
+
+        Parameters:
+            organise (Organise): Configuration object for a single job
+            data (any): Extracted data of a feed or feed element
+            name (str): File name to use for the temporary NTriples file
+            store (OxigraphStore|list|None): Store to load the triples into, or list to collect them as NTriples rows
+    '''
+
+    # Save temporary file, which generates the triples, or only generate them
+    mapped = data.map('cto3')
+    if 'cto3' in organise.output:
+        mapped.save(organise.folder_cto3 + '/' + name, 'nt', organise.prepare)
+    else:
+        mapped.generate(organise.prepare)
+
+    # Load the same triples into the store or collect them for the main process
+    if mapped.rdf:
+        if isinstance(store, OxigraphStore):
+            store.add(mapped.rdf)
+        elif isinstance(store, list):
+            store += [ntriples_row(triple) for triple in mapped.rdf]
+
+
+def start_worker(organise:Organise, keyvalue:any, lock:any):
+    '''
+    Set up a worker process to harvest local feed elements
+
+        Parameters:
+            organise (Organise): Configuration object for a single job
+            keyvalue (any): Look-up store shared by all worker processes
+            lock (any): Lock shared by all worker processes to request authority files one at a time
+    '''
+
+    # Log to the same file as the main process
+    logging.basicConfig(filename = organise.log, level = logging.INFO)
+
+    # Do not share open ZIP archives with the main process
+    close_zips()
+
+    # Keep configuration and look-up store for all tasks
+    worker['organise'] = organise
+    worker['lookup'] = Lookup()
+    worker['lookup'].keyvalue = keyvalue
+    worker['lookup'].lock = lock
+
+
+def harvest_element_worker(element_uri:str, element_name:str) -> tuple:
+    '''
+    Retrieve and harvest a single local feed element in a worker process
+
+        Parameters:
+            element_uri (str): Local path of the feed element
+            element_name (str): File name to use for the outputs
+
+        Returns:
+            tuple: Success, media to download, Parquet rows, and NTriples rows for the store
+    '''
+
+    # Get feed element
+    organise = worker['organise']
+    lookup = worker['lookup']
+    element_file = File(element_uri, organise.dialect, ba_username = organise.ba_username, ba_password = organise.ba_password)
+
+    # Save, extract, reconcile, and map element, collecting triples as only the main process may open the store
+    triples = []
+    if 'store' in organise.output:
+        element_data = harvest_element(organise, lookup, element_file, element_uri, element_name, triples)
+    else:
+        element_data = harvest_element(organise, lookup, element_file, element_uri, element_name)
+    success = element_data != None or not organise.elements
+
+    # Hand media back to the main process to respect request delays
+    media = None
+    if 'media' in organise.output and element_data:
+        if element_data.media:
+            media = (element_data.media.uri.uri, element_data.element_uri.uri)
+
+    # Hand back Parquet rows to write them into a single file
+    rows = []
+    if 'parquet' in organise.output and element_data:
+        rows = table_rows(organise, element_data)
+
+    # Return result
+    return success, media, rows, triples
+
+
 class Progress:
 
 
@@ -433,17 +836,22 @@ class Progress:
             print('▹ ' + self.note, end = '\r')
 
 
-    def update(self, current:int, max:int):
+    def update(self, current:int, max:int|None):
         '''
         Update progress line with percentage
 
             Parameters:
                 current (int): Current number used to calculate a percentage
-                max (int): Total number used to calculate a percentage
+                max (int|None): Known or estimated total number used to calculate a percentage
         '''
 
+        # Show plain count if there is no total or the estimate was too low
+        if max == None or (current > max and not self.success):
+            if not self.quiet:
+                print('▹ ' + self.note + str(current), end = '\r')
+
         # Calculate percentage
-        if current < max:
+        elif current < max:
             progress = int((current / max ) * 100)
 
             # Show note
@@ -466,7 +874,7 @@ class Progress:
                 print('▸ ' + self.note + 'done')
 
 
-def combine_text(folder:str, file_path:str, file_extension:str, ignore:str):
+def combine_text(folder:str, file_path:str, file_extension:str, ignore:str, compress:str|None = None, level:int|None = None):
     '''
     Collects text files and saves them in a single file
 
@@ -475,14 +883,16 @@ def combine_text(folder:str, file_path:str, file_extension:str, ignore:str):
             file_path (str): Path of the file to create
             file_extension (str): Extension of the file to create
             ignore (str): Start of lines to ignore
+            compress (str|None): Streaming compression to use, 'gzip' or 'zstd'
+            level (int|None): Compression level
     '''
 
-    # Prepare paths
+    # Prepare paths, sorted to keep the header file first and the result stable
     file_path += '.' + file_extension
-    paths = files_in_folder(folder)
+    paths = sorted(files_in_folder(folder))
 
     # File by file, and line by line
-    with open(file_path, 'w') as collated:
+    with TextIOWrapper(open_compressed(file_path, compress, level), encoding = 'utf-8') as collated:
         for p, path in enumerate(paths):
 
             # Add line break on consecutive files
@@ -496,10 +906,10 @@ def combine_text(folder:str, file_path:str, file_extension:str, ignore:str):
                         collated.write(line)
 
     # Log info
-    logger.info('Combined temporary text files into ' + file_path)
+    logger.info('Combined temporary text files into ' + file_path + compression_extensions.get(compress, ''))
 
 
-def combine_triples(folder:str, file_path:str, use_ntriples:bool = False):
+def combine_triples(folder:str, file_path:str, use_ntriples:bool = False, compress:str|None = None, level:int|None = None):
     '''
     Parses all Turtle files in a folder and saves them as a single file
 
@@ -507,6 +917,8 @@ def combine_triples(folder:str, file_path:str, use_ntriples:bool = False):
             folder (str): Path of the folder to parse
             file_path (str): Path of the file to create
             use_ntriples (bool): Whether to use ntriples instead of Turtle
+            compress (str|None): Streaming compression to use, 'gzip' or 'zstd'
+            level (int|None): Compression level
     '''
 
     # Prepare paths
@@ -514,7 +926,7 @@ def combine_triples(folder:str, file_path:str, use_ntriples:bool = False):
         file_path += '.nt'
     else:
         file_path += '.ttl'
-    paths = files_in_folder(folder)
+    paths = sorted(files_in_folder(folder))
 
     # Calculate size of folder
     folder_size = 0
@@ -530,7 +942,8 @@ def combine_triples(folder:str, file_path:str, use_ntriples:bool = False):
             rdf_format = RdfFormat.TURTLE
         for path in paths:
             rdf.load(path = path, format = rdf_format, to_graph = DefaultGraph(), lenient = True)
-        rdf.dump(output = file_path, format = rdf_format, from_graph = DefaultGraph())
+        with open_compressed(file_path, compress, level) as output:
+            rdf.dump(output = output, format = rdf_format, from_graph = DefaultGraph())
 
     # Parse and save using rdflib (slow and pretty, hogs more memory)
     else:
@@ -542,7 +955,8 @@ def combine_triples(folder:str, file_path:str, use_ntriples:bool = False):
             rdf_format = 'turtle'
         for path in paths:
             rdf.parse(path, format = rdf_format)
-        rdf.serialize(destination = file_path, format = rdf_format, encoding = 'utf-8')
+        with open_compressed(file_path, compress, level) as output:
+            rdf.serialize(destination = output, format = rdf_format, encoding = 'utf-8')
 
     # Log info
-    logger.info('Combined temporary RDF files into ' + file_path)
+    logger.info('Combined temporary RDF files into ' + file_path + compression_extensions.get(compress, ''))
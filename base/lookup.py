@@ -12,9 +12,9 @@ import logging
 from httpx import Client, HTTPError
 from os.path import isfile
 from rdflib import URIRef, Namespace
-from validators import url
 
 # Import script modules
+from base.data import is_url
 from base.file import File
 
 # Define namespaces
@@ -66,6 +66,7 @@ class Lookup:
         # Vars
         self.file_path:str|None = None
         self.keyvalue:dict = {}
+        self.lock:any = None
 
         # Read and parse existing key-value store
         if file_path:
@@ -101,10 +102,29 @@ class Lookup:
                 str|None: Shorthand of the category the URI belong to
         '''
 
+        # Let worker processes request authority files one at a time and reuse each other's results
+        if self.lock and uri not in self.keyvalue and is_remote(uri):
+            with self.lock:
+                return self.check_uri(uri)
+        else:
+            return self.check_uri(uri)
+
+
+    def check_uri(self, uri:str) -> str|None:
+        '''
+        Check an authority file URI in the key-value store, by its namespace, or remotely
+
+            Parameters:
+                uri (str): Authority file URI to check
+
+            Returns:
+                str|None: Shorthand of the category the URI belong to
+        '''
+
         # Check local key-value store as a shortcut
         output = None
         if uri in self.keyvalue:
-            if url(self.keyvalue[uri]):
+            if is_url(self.keyvalue[uri]):
                 uri = self.keyvalue[uri]
             output = self.keyvalue[uri]
 
@@ -235,6 +255,22 @@ class Lookup:
         return output
 
 
+def is_remote(uri:str) -> bool:
+    '''
+    Check whether an authority file URI can only be categorised by requesting it
+
+        Parameters:
+            uri (str): Authority file URI to check
+
+        Returns:
+            bool: Whether the URI belongs to GND, VIAF, Getty AAT, FactGrid, or Wikidata
+    '''
+
+    # Check namespaces
+    uri = URIRef(uri)
+    return uri in GND or uri in VIAF or uri in AAT or uri in FG or uri in WD
+
+
 def sparql(endpoint:str, query_type:str, query:str) -> bool|list|None:
     '''
     Check whether a boolean SPARQL query returns true or false
@@ -8,15 +8,203 @@
 
 # Import libraries
 import logging
-from rdflib import Graph
+from collections.abc import Iterator
+from functools import lru_cache
+from pyoxigraph import DefaultGraph, Quad, RdfFormat, Store, parse
+from rdflib import Graph, Namespace
+from rdflib.term import Literal, Node
 
 # Import script modules
 from base.data import Uri, UriList, Label, LabelList, UriLabelList, Date, DateList, Incipit, Media
+from base.file import to_oxigraph
+
+# Define namespaces
+SCHEMA = Namespace('http://schema.org/')
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
 
+class NTriples:
+
+
+    def __init__(self, namespaces:tuple = ()):
+        '''
+        Collect triples in insertion order and serialise them straight to NTriples
+
+            Parameters:
+                namespaces (tuple): Prefix and namespace pairs to use when serialising to other formats
+        '''
+
+        # Vars
+        self.triples:dict = {}
+        self.namespaces:tuple = namespaces
+
+
+    def __len__(self) -> int:
+        '''
+        Number of distinct triples
+
+            Returns:
+                int: Number of triples
+        '''
+
+        # Return length
+        return len(self.triples)
+
+
+    def __iter__(self) -> Iterator:
+        '''
+        Iterate over triples in insertion order
+
+            Returns:
+                Iterator: Triples as tuples of RDFLib terms
+        '''
+
+        # Return iterator
+        return iter(self.triples)
+
+
+    def __iadd__(self, other:any) -> any:
+        '''
+        Add all triples of another sink or graph
+
+            Parameters:
+                other (any): NTriples sink or RDFLib graph to add
+
+            Returns:
+                any: This sink
+        '''
+
+        # Merge sinks directly, go through triples otherwise
+        if isinstance(other, NTriples):
+            self.triples.update(other.triples)
+        else:
+            for triple in other:
+                self.add(triple)
+        return self
+
+
+    def add(self, triple:tuple):
+        '''
+        Add a triple unless it is already there
+
+            Parameters:
+                triple (tuple): Subject, predicate, and object as RDFLib terms
+        '''
+
+        # Check terms as RDFLib graphs do, but only for missing ones
+        s, p, o = triple
+        assert s is not None, 'Subject %s must be an rdflib term' % (s,)
+        assert p is not None, 'Predicate %s must be an rdflib term' % (p,)
+        assert o is not None, 'Object %s must be an rdflib term' % (o,)
+
+        # Keep first occurrence only
+        self.triples[triple] = None
+
+
+    def serialize(self, destination:str, format:str = 'nt', encoding:str = 'utf-8'):
+        '''
+        Write triples to a file
+
+            Parameters:
+                destination (str): Path of the file to create
+                format (str): RDFLib file format to use, NTriples is written without RDFLib
+                encoding (str): Encoding of the file
+        '''
+
+        # Stream NTriples rows to the file without building the whole document
+        if format == 'nt':
+            with open(destination, 'w', encoding = encoding, newline = '') as f:
+                f.writelines(ntriples_row(triple) for triple in self.triples)
+
+        # Use an RDFLib graph for other formats
+        else:
+            if len(self.namespaces) > 0:
+                rdf = Graph(bind_namespaces = 'none')
+                for prefix, namespace in self.namespaces:
+                    rdf.store.bind(prefix, namespace)
+            else:
+                rdf = Graph()
+                rdf.bind('schema', SCHEMA, replace = True) # "Replace" overrides the RDFLib schema namespace (SDO), which uses "https"
+            for triple in self.triples:
+                rdf.add(triple)
+            rdf.serialize(destination = destination, format = format, encoding = encoding)
+
+
+class OxigraphStore:
+
+
+    def __init__(self, folder_path:str, batch_size:int = 100000):
+        '''
+        Bulk-load triples into a persistent pyoxigraph store in batches
+
+            Parameters:
+                folder_path (str): Path of the folder to keep the store in
+                batch_size (int): Number of triples to collect before loading them
+        '''
+
+        # Vars
+        self.folder_path:str = folder_path
+        self.batch_size:int = batch_size
+        self.quads:list = []
+        self.store:Store = Store(folder_path)
+
+
+    def add(self, triples:Iterator):
+        '''
+        Add triples and load a batch once enough are collected
+
+            Parameters:
+                triples (Iterator): Triples as tuples of RDFLib terms
+        '''
+
+        # Collect triples in the default graph
+        for s, p, o in triples:
+            self.quads.append(Quad(oxigraph_node(s), oxigraph_node(p), oxigraph_node(o), DefaultGraph()))
+        if len(self.quads) >= self.batch_size:
+            self.flush()
+
+
+    def add_ntriples(self, rows:list):
+        '''
+        Add triples serialised as NTriples rows, e.g. by worker processes
+
+            Parameters:
+                rows (list): NTriples rows including line breaks
+        '''
+
+        # Parse rows into quads of the default graph
+        self.quads += parse(input = ''.join(rows), format = RdfFormat.N_TRIPLES)
+        if len(self.quads) >= self.batch_size:
+            self.flush()
+
+
+    def flush(self):
+        '''
+        Load collected triples without a transaction
+        '''
+
+        # Load and forget triples
+        if len(self.quads) > 0:
+            self.store.bulk_extend(self.quads)
+            self.quads = []
+
+
+    def close(self):
+        '''
+        Load remaining triples and write them to disk
+        '''
+
+        # Flush and optimise for queries
+        self.flush()
+        self.store.flush()
+        self.store.optimize()
+
+        # Log info
+        logger.info('Loaded triples into store ' + self.folder_path)
+
+
 class MapInterface:
 
 
@@ -30,7 +218,7 @@ class MapInterface:
 
         # Vars
         self.success:bool = False
-        self.rdf:Graph = Graph()
+        self.rdf:Graph|NTriples|None = None
         self.content:str|None = None
         self.file_extension:str|None = None
 
@@ -466,3 +654,79 @@ class MapFeedElementInterface(MapInterface):
             self.approximate_period = data.approximate_period
         if data.existence_period:
             self.existence_period = data.existence_period
+
+
+def ntriples_row(triple:tuple) -> str:
+    '''
+    Produce an NTriples line exactly like the RDFLib serialiser does
+
+        Parameters:
+            triple (tuple): Subject, predicate, and object as RDFLib terms
+
+        Returns:
+            str: Line including the final dot and line break
+    '''
+
+    # Quote literals, let RDFLib check and wrap URIs and blank nodes
+    s, p, o = triple
+    if isinstance(o, Literal):
+        return ntriples_node(s) + ' ' + ntriples_node(p) + ' ' + ntriples_literal(o) + ' .\n'
+    else:
+        return ntriples_node(s) + ' ' + ntriples_node(p) + ' ' + ntriples_node(o) + ' .\n'
+
+
+@lru_cache(maxsize = 65536)
+def oxigraph_node(node:Node) -> any:
+    '''
+    Convert an RDFLib term to a pyoxigraph term, cached as terms repeat across elements
+
+        Parameters:
+            node (Node): RDFLib term
+
+        Returns:
+            any: Pyoxigraph term
+    '''
+
+    # Return converted term
+    return to_oxigraph(node)
+
+
+@lru_cache(maxsize = 65536)
+def ntriples_node(node:Node) -> str:
+    '''
+    Serialise a URI or blank node for NTriples, remembering recent results
+
+        Parameters:
+            node (Node): URI or blank node to serialise
+
+        Returns:
+            str: Node in NTriples notation
+    '''
+
+    # Let RDFLib check and wrap the node
+    return node.n3()
+
+
+def ntriples_literal(literal:Literal) -> str:
+    '''
+    Escape and quote a literal for NTriples
+
+        Parameters:
+            literal (Literal): Literal to serialise
+
+        Returns:
+            str: Quoted literal with language tag or data type
+    '''
+
+    # Escape backslashes, line breaks, and quotes
+    encoded = '"' + str(literal).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"').replace('\r', '\\r') + '"'
+
+    # Add language or data type
+    if literal.language:
+        if literal.datatype:
+            raise Exception('Literal has datatype AND language!')
+        return encoded + '@' + literal.language
+    elif literal.datatype:
+        return encoded + '^^<' + str(literal.datatype) + '>'
+    else:
+        return encoded
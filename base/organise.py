@@ -14,9 +14,9 @@ from http.client import InvalidURL
 from os.path import isdir, isfile
 from time import sleep
 from urllib.robotparser import RobotFileParser
-from validators import url
 
 # Import script modules
+from base.data import is_url
 from base.file import create_folder
 
 # Set up logging
@@ -67,6 +67,10 @@ class Organise:
         self.prepare:list|None = None
         self.ba_username:str|None = None
         self.ba_password:str|None = None
+        self.workers:int|None = None
+        self.page_workers:int|None = None
+        self.compress:str|None = None
+        self.compress_level:int|None = None
         self.quiet:bool = False
 
         # Set up list of allowed arguments
@@ -113,6 +117,8 @@ class Organise:
                 'cto',
                 'cto3',
                 'media',
+                'parquet',
+                'store',
                 'files',
                 'triples'
             ],
@@ -207,6 +213,34 @@ class Organise:
             type = str,
             help = 'Basic Auth password for requests'
         )
+        available_args.add_argument(
+            '-w', '--workers',
+            default = None,
+            type = int,
+            help = 'Number of processes to harvest local folder or ZIP feed elements in parallel, sharing one look-up store and requesting authority files one at a time'
+        )
+        available_args.add_argument(
+            '-pw', '--page_workers',
+            default = None,
+            type = int,
+            help = 'Number of feed pages to retrieve in parallel if their URIs can be derived from the first page'
+        )
+        available_args.add_argument(
+            '-z', '--compress',
+            choices = [
+                'gzip',
+                'zstd'
+            ],
+            default = None,
+            type = str,
+            help = 'Streaming compression to apply to compiled outputs'
+        )
+        available_args.add_argument(
+            '-zl', '--compress_level',
+            default = None,
+            type = int,
+            help = 'Compression level, 1 to 9 for gzip and 1 to 22 for zstd'
+        )
         available_args.add_argument(
             '-q', '--quiet',
             default = False,
@@ -236,22 +270,26 @@ class Organise:
         self.prepare = args.prepare
         self.ba_username = args.ba_username
         self.ba_password = args.ba_password
+        self.workers = args.workers
+        self.page_workers = args.page_workers
+        self.compress = args.compress
+        self.compress_level = args.compress_level
         self.quiet = args.quiet
 
         # Check location based on feed parameter
         if self.feed == 'folder':
-            if not url(self.location) and not isfile(self.location) and not isdir(self.location):
+            if not is_url(self.location) and not isfile(self.location) and not isdir(self.location):
                 raise ValueError('Hydra Scraper called with a malformed folder location.')
         elif self.feed in ['beacon', 'cmif', 'csv', 'schema', 'schema-list']:
-            if not url(self.location) and not isfile(self.location):
+            if not is_url(self.location) and not isfile(self.location):
                 raise ValueError('Hydra Scraper called with a malformed entry-point location.')
         elif self.feed in ['oaipmh']:
-            if not url(self.location):
+            if not is_url(self.location):
                 raise ValueError('Hydra Scraper called with a malformed API location.')
 
         # Catch output commands that require data extraction
         if not self.elements:
-            if 'beacon' in self.output or 'csv' in self.output or 'cto' in self.output or 'cto3' in self.output:
+            if 'beacon' in self.output or 'csv' in self.output or 'cto' in self.output or 'cto3' in self.output or 'parquet' in self.output or 'store' in self.output:
                 raise ValueError('Hydra Scraper called with extraction routine but no element markup.')
 
         # Check prepare arguments
@@ -267,9 +305,32 @@ class Organise:
         elif self.ba_username == None and self.ba_password != None:
             raise ValueError('Hydra Scraper called with Basic Auth password but no username.')
 
+        # Check worker processes
+        if self.workers != None:
+            if self.workers < 1:
+                raise ValueError('Hydra Scraper called with less than one worker process.')
+            elif self.feed != 'folder':
+                raise ValueError('Hydra Scraper only supports worker processes for folder feeds.')
+
+        # Check page workers
+        if self.page_workers != None:
+            if self.page_workers < 1:
+                raise ValueError('Hydra Scraper called with less than one page worker.')
+            elif self.feed not in ['schema', 'schema-list']:
+                raise ValueError('Hydra Scraper only supports page workers for paginated schema.org feeds.')
+
+        # Check compression level
+        if self.compress_level != None:
+            if self.compress == None:
+                raise ValueError('Hydra Scraper called with a compression level but no compression.')
+            elif self.compress == 'gzip' and not 1 <= self.compress_level <= 9:
+                raise ValueError('Hydra Scraper only supports gzip compression levels from 1 to 9.')
+            elif self.compress == 'zstd' and not 1 <= self.compress_level <= 22:
+                raise ValueError('Hydra Scraper only supports zstd compression levels from 1 to 22.')
+
         # Check further URIs
         for uri in [self.add_feed, self.add_catalog, self.add_publisher, self.add_type]:
-            if uri != None and not url(uri):
+            if uri != None and not is_url(uri):
                 raise ValueError('Hydra Scraper called with a malformed URI to add.')
 
         # Get delay based on robots.txt
@@ -362,7 +423,7 @@ def robots_delay(location:str, robots_user_agent:str = 'HydraScraper') -> int|No
 
     # URL
     try:
-        if url(location):
+        if is_url(location):
             index = location.find('/')
             if index:
                 index = location.find('/', index + 2)
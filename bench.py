@@ -0,0 +1,246 @@
+# Benchmarks for extractors and mappings
+#
+# This file is part of the Hydra Scraper package.
+#
+# For the full copyright and license information, please read the
+# LICENSE.txt file that was distributed with this source code.
+
+
+# Import libraries
+import logging
+from datetime import date, datetime
+from sys import argv
+from timeit import timeit
+from tracemalloc import get_traced_memory, start, stop
+from validators import url
+
+# Import script modules
+import extract.lido as lido
+from base.data import Date, Uri, clean_namespaces, clean_uri, is_url, parse_date
+from base.file import File
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Number of repetitions per measurement
+repeat:int = 100
+
+# LIDO fixtures, unless file paths or URIs are given on the command line
+lido_locations:list = [
+    'https://corpusvitrearum.de/id/F13494/about.lido',
+    'https://www.graphikportal.org/lido-examples/Technisches_Beispiel.xml'
+]
+
+
+def report(label:str, seconds:float, count:int):
+    '''
+    Print the time a benchmark took per item
+
+        Parameters:
+            label (str): Name of the measurement
+            seconds (float): Total time in seconds
+            count (int): Number of items processed
+    '''
+
+    # Print result
+    print(label.ljust(40) + str(round(seconds / count * 1000, 4)) + ' ms')
+
+
+def lido_text(files:list):
+    '''
+    Compare normalize-space XPath calls with the cached node text of LIDO extracts
+
+        Parameters:
+            files (list): Retrieved LIDO files
+    '''
+
+    # Each node is read three times, roughly as the extraction routines do
+    extracts = [lido.FeedElement(file) for file in files]
+    def xpath_text():
+        for file in files:
+            for node in file.xml.iter():
+                for i in range(3):
+                    node.xpath('normalize-space(string())')
+    def cached_text():
+        for extract in extracts:
+            extract.xml_text_cache = {}
+            for node in extract.file.xml.iter():
+                for i in range(3):
+                    extract.xml_text(node)
+    def extraction():
+        for file in files:
+            lido.FeedElement(file)
+
+    # Measure and print results
+    print('LIDO text normalisation, ' + str(len(files)) + ' fixtures')
+    report('normalize-space XPath per record', timeit(xpath_text, number = repeat), repeat * len(files))
+    report('cached itertext per record', timeit(cached_text, number = repeat), repeat * len(files))
+    report('full extraction per record', timeit(extraction, number = repeat), repeat * len(files))
+
+
+def data_memory(files:list):
+    '''
+    Measure the memory that extracted LIDO data retains per element
+
+        Parameters:
+            files (list): Retrieved LIDO files
+    '''
+
+    # Keep extracted elements alive but drop their lookup caches
+    start()
+    before = get_traced_memory()[0]
+    extracts = []
+    for i in range(repeat):
+        for file in files:
+            extract = lido.FeedElement(file)
+            extract.xml_text_cache = {}
+            extract.xml_lang_cache = {}
+            extracts.append(extract)
+    after = get_traced_memory()[0]
+    stop()
+
+    # Print result
+    print('Data model memory, ' + str(len(files)) + ' fixtures')
+    print('retained per element'.ljust(40) + str(round((after - before) / len(extracts) / 1024, 2)) + ' KiB')
+
+
+def uri_check(files:list):
+    '''
+    Compare validating and normalising every URI with the cached clean-up
+
+        Parameters:
+            files (list): Retrieved LIDO files
+    '''
+
+    # Collect URIs from texts and attributes, repeated as if in many elements
+    corpus = []
+    for file in files:
+        for node in file.xml.iter():
+            for value in [node.text] + list(node.attrib.values()):
+                if value != None and value.strip().startswith('http'):
+                    corpus.append(value.strip())
+    corpus = corpus * repeat
+
+    # Check and clean each URI
+    def uncached_uri():
+        for uri in corpus:
+            if url(uri):
+                clean_namespaces(uri)
+    def cached_uri():
+        is_url.cache_clear()
+        clean_uri.cache_clear()
+        for uri in corpus:
+            clean_uri(uri, True)
+
+    # Measure and print results
+    print('URI validation, ' + str(len(corpus)) + ' URIs, ' + str(len(set(corpus))) + ' distinct')
+    report('validators and clean-up per URI', timeit(uncached_uri, number = 1), len(corpus))
+    report('cached clean_uri per URI', timeit(cached_uri, number = 1), len(corpus))
+
+
+def date_parse(files:list):
+    '''
+    Compare parsing dates by trial and error with classifying them first
+
+        Parameters:
+            files (list): Retrieved LIDO files
+    '''
+
+    # Typical date literals plus the event dates of the LIDO fixtures
+    corpus = [
+        '1450', 'ca. 1500', '1450/1460', 'um 1600', '15. Jh.', '1600-1650', 'undatiert',
+        '2024-05-01', '1450-05-01/1460-12-31', '2019-01-01T00:00:00', '2019-01-01T00:00:00+01:00'
+    ]
+    for file in files:
+        for tag in ['displayDate', 'earliestDate', 'latestDate']:
+            for node in file.xml.iter('{http://www.lido-schema.org}' + tag):
+                if node.text != None:
+                    corpus.append(node.text.strip())
+    corpus = corpus * repeat
+
+    # Parse each date by trial and error as well as through the classifier
+    def trial_date():
+        for input in corpus:
+            if '/' in input:
+                for half, time in zip(input.split('/', 1), ['T00:00:00', 'T23:59:59']):
+                    try:
+                        datetime.fromisoformat(half + time)
+                    except ValueError:
+                        try:
+                            datetime.fromisoformat(half)
+                        except ValueError:
+                            pass
+            else:
+                try:
+                    date.fromisoformat(input)
+                except ValueError:
+                    try:
+                        datetime.fromisoformat(input)
+                    except ValueError:
+                        pass
+    def classified_date():
+        parse_date.cache_clear()
+        for input in corpus:
+            parse_date(input)
+    def date_objects():
+        parse_date.cache_clear()
+        for input in corpus:
+            Date(input)
+
+    # Measure and print results
+    print('Date parsing, ' + str(len(corpus)) + ' literals, ' + str(len(set(corpus))) + ' distinct')
+    report('trial and error per literal', timeit(trial_date, number = 1), len(corpus))
+    report('cached classifier per literal', timeit(classified_date, number = 1), len(corpus))
+    report('Date objects per literal', timeit(date_objects, number = 1), len(corpus))
+
+
+def cto3_map(files:list):
+    '''
+    Compare generating cto3 triples with serialising them and with cto Turtle
+
+        Parameters:
+            files (list): Retrieved LIDO files
+    '''
+
+    # Add a feed URI where the fixtures lack one
+    extracts = [lido.FeedElement(file) for file in files]
+    for extract in extracts:
+        if not extract.feed_uri:
+            extract.feed_uri = Uri('https://example.org/feed')
+
+    # Generate and serialise the triples of each element
+    def cto3_generate():
+        for extract in extracts:
+            extract.map('cto3').generate(['E0', 'E1', 'no-license-check'])
+    def cto3_ntriples():
+        for extract in extracts:
+            extract.map_and_ntriples('cto3', 'downloads/bench', ['E0', 'E1', 'no-license-check'])
+    def cto_turtle():
+        for extract in extracts:
+            extract.map_and_turtle('cto', 'downloads/bench', ['E0', 'E1', 'no-license-check'])
+
+    # Measure and print results
+    print('Mapping to cto and cto3, ' + str(len(extracts)) + ' fixtures')
+    report('cto3 triples per element', timeit(cto3_generate, number = repeat), repeat * len(extracts))
+    report('cto3 NTriples per element', timeit(cto3_ntriples, number = repeat), repeat * len(extracts))
+    report('cto Turtle per element', timeit(cto_turtle, number = repeat), repeat * len(extracts))
+
+
+# Benchmarks to run in this order
+benchmarks:dict = {
+    'lido-text': lido_text,
+    'data-memory': data_memory,
+    'uri-check': uri_check,
+    'date-parse': date_parse,
+    'cto3-map': cto3_map
+}
+
+
+# Run all benchmarks on the same fixtures
+if __name__ == '__main__':
+    logging.basicConfig(filename = 'downloads/bench.log', filemode = 'w', level = logging.INFO)
+    locations = argv[1:] or lido_locations
+    files = [File(location) for location in locations]
+    files = [file for file in files if file.success]
+    for benchmark in benchmarks.values():
+        benchmark(files)
@@ -11,7 +11,6 @@ from re import search
 
 # Import script modules
 from base.data import Uri, UriList, Date
-from base.file import strip_lines
 from base.extract import ExtractFeedInterface
 
 
@@ -59,21 +58,28 @@ class Feed(ExtractFeedInterface):
                 str|None: Requested information
         '''
 
-        # Find match
-        regex = r"(?<=#" + pattern + ":).*(?<!\n)"
-        match = search(regex, self.file.text)
-        if match:
-            return match.group().strip()
-        else:
-            return None
+        # Find match in header lines only
+        regex = r"(?<=#" + pattern + ":).*"
+        for line in self.file.lines():
+            if line.startswith('#'):
+                match = search(regex, line)
+                if match:
+                    return match.group().strip()
 
+            # Stop at the first line that is not a header
+            elif line.strip():
+                break
 
-    def beacon_uris(self) -> list:
+        # Return nothing if there is no match
+        return None
+
+
+    def beacon_uris(self):
         '''
         Retrieve URIs from Beacon files and plain-text URI lists
 
             Returns:
-                list: URIs listed in Beacon or plain-text files
+                generator: Unique URIs listed in Beacon or plain-text files, in their original order
         '''
 
         # Identify and check the ID pattern if provided
@@ -82,22 +88,24 @@ class Feed(ExtractFeedInterface):
             if pattern.find('{ID}') == -1:
                 pattern = None
 
-        # Remove empty lines and comments
-        lines = strip_lines(self.file.text)
-        lines = lines.splitlines()
-
-        # In each line, remove additional Beacon features
-        for i in range(len(lines)):
-            line_option1 = lines[i].find(' |')
-            line_option2 = lines[i].find('|')
-            if line_option1 != -1:
-                lines[i] = lines[i][:line_option1]
-            elif line_option2 != -1:
-                lines[i] = lines[i][:line_option2]
-
-            # Resolve ID pattern
-            if pattern:
-                lines[i] = pattern.replace('{ID}', lines[i])
-
-        # Return unique results
-        return list(set(lines))
+        # Go through lines, leaving out empty lines and comments
+        seen = set()
+        for line in self.file.lines():
+            if line.strip() and line[0] != '#':
+
+                # Remove additional Beacon features
+                line_option1 = line.find(' |')
+                line_option2 = line.find('|')
+                if line_option1 != -1:
+                    line = line[:line_option1]
+                elif line_option2 != -1:
+                    line = line[:line_option2]
+
+                # Resolve ID pattern
+                if pattern:
+                    line = pattern.replace('{ID}', line)
+
+                # Only return unique results
+                if line not in seen:
+                    seen.add(line)
+                    yield line
@@ -49,21 +49,19 @@ class FeedElement(ExtractFeedElementInterface):
             # Element type shorthand
             self.element_type_short = 'item'
 
+            # Collect resources and events in a single pass
+            self.lido_index()
+
             # Data concept shorthand (check for provided 3D, video, image, audio, or text representations)
-            data_concept_short = self.xml_first_text('.//{L}resourceWrap/{L}resourceSet/{L}resourceRepresentation[@{L}type="http://terminology.lido-schema.org/lido00468"]/{L}linkResource')
-            if data_concept_short != None:
+            if self.lido_resource('http://terminology.lido-schema.org/lido00468') != None:
                 self.data_concept_short.add('3d-model')
-            data_concept_short = self.xml_first_text('.//{L}resourceWrap/{L}resourceSet/{L}resourceRepresentation[@{L}type="http://terminology.lido-schema.org/lido00466"]/{L}linkResource')
-            if data_concept_short != None:
+            if self.lido_resource('http://terminology.lido-schema.org/lido00466') != None:
                 self.data_concept_short.add('video')
-            data_concept_short = self.xml_first_text('.//{L}resourceWrap/{L}resourceSet/{L}resourceRepresentation[@{L}type="http://terminology.lido-schema.org/lido00464"]/{L}linkResource')
-            if data_concept_short != None:
+            if self.lido_resource('http://terminology.lido-schema.org/lido00464') != None:
                 self.data_concept_short.add('image')
-            data_concept_short = self.xml_first_text('.//{L}resourceWrap/{L}resourceSet/{L}resourceRepresentation[@{L}type="http://terminology.lido-schema.org/lido00465"]/{L}linkResource')
-            if data_concept_short != None:
+            if self.lido_resource('http://terminology.lido-schema.org/lido00465') != None:
                 self.data_concept_short.add('audio')
-            data_concept_short = self.xml_first_text('.//{L}resourceWrap/{L}resourceSet/{L}resourceRepresentation[@{L}type="http://terminology.lido-schema.org/lido00482"]/{L}linkResource')
-            if data_concept_short != None:
+            if self.lido_resource('http://terminology.lido-schema.org/lido00482') != None:
                 self.data_concept_short.add('text')
 
             # Label and alternative label (overflow mechanic; some LIDO files fall back to object numbers as titles instead of generic terms)
@@ -96,15 +94,15 @@ class FeedElement(ExtractFeedElementInterface):
             #self.shelf_mark = 
 
             # Media (select first regular image or regular audio or regular representation or preview image or preview audio)
-            self.media = Media(self.xml_first_text('.//{L}resourceWrap/{L}resourceSet/{L}resourceRepresentation[@{L}type="http://terminology.lido-schema.org/lido00464"]/{L}linkResource'), type = 'image')
+            self.media = Media(self.lido_resource('http://terminology.lido-schema.org/lido00464'), type = 'image')
             if not self.media:
-                self.media = Media(self.xml_first_text('.//{L}resourceWrap/{L}resourceSet/{L}resourceRepresentation[@{L}type="http://terminology.lido-schema.org/lido00465"]/{L}linkResource'), type = 'audio')
+                self.media = Media(self.lido_resource('http://terminology.lido-schema.org/lido00465'), type = 'audio')
             if not self.media:
-                self.media = Media(self.xml_first_text('.//{L}resourceWrap/{L}resourceSet/{L}resourceRepresentation[@{L}type="http://terminology.lido-schema.org/lido00481"]/{L}linkResource'), type = 'image')
+                self.media = Media(self.lido_resource('http://terminology.lido-schema.org/lido00481'), type = 'image')
             if not self.media:
-                self.media = Media(self.xml_first_text('.//{L}resourceWrap/{L}resourceSet/{L}resourceRepresentation[@{L}type="http://terminology.lido-schema.org/lido00451"]/{L}linkResource'), type = 'image')
+                self.media = Media(self.lido_resource('http://terminology.lido-schema.org/lido00451'), type = 'image')
             if not self.media:
-                self.media = Media(self.xml_first_text('.//{L}resourceWrap/{L}resourceSet/{L}resourceRepresentation[@{L}type="http://terminology.lido-schema.org/lido00452"]/{L}linkResource'), type = 'audio')
+                self.media = Media(self.lido_resource('http://terminology.lido-schema.org/lido00452'), type = 'audio')
 
             # Media license
             if self.media:
@@ -168,7 +166,7 @@ class FeedElement(ExtractFeedElementInterface):
             repo_location = self.xml_uri_label(self.xml_first_element('.//{L}objectIdentificationWrap/{L}repositoryWrap/{L}repositorySet/{L}repositoryLocation'), ['./{L}placeID[@{L}type="http://terminology.lido-schema.org/lido00099"]', './{L}placeID[@{L}type="uri"]'], './{L}namePlaceSet/{L}appellationValue')
             if repo_location != None:
                 vocab_related_location += repo_location
-            event_locations = self.xml_uri_label(self.xml_all_elements('.//{L}eventWrap/{L}eventSet/{L}event/{L}eventPlace'), ['./{L}place/{L}placeID[@{L}type="http://terminology.lido-schema.org/lido00099"]', './{L}place/{L}placeID[@{L}type="uri"]'], ['./{L}displayPlace', './{L}place/{L}namePlaceSet/{L}appellationValue'], True)
+            event_locations = self.xml_uri_label(self.lido_event_places, ['./{L}place/{L}placeID[@{L}type="http://terminology.lido-schema.org/lido00099"]', './{L}place/{L}placeID[@{L}type="uri"]'], ['./{L}displayPlace', './{L}place/{L}namePlaceSet/{L}appellationValue'], True)
             if event_locations != None:
                 vocab_related_location += event_locations
             subject_locations = self.xml_uri_label(self.xml_all_elements('.//{L}objectRelationWrap/{L}subjectWrap/{L}subjectSet/{L}subject/{L}subjectPlace'), ['./{L}place/{L}placeID[@{L}type="http://terminology.lido-schema.org/lido00099"]', './{L}place/{L}placeID[@{L}type="uri"]'], ['./{L}displayPlace', './{L}place/{L}namePlaceSet/{L}appellationValue'], True)
@@ -180,11 +178,11 @@ class FeedElement(ExtractFeedElementInterface):
             #self.vocab_related_event = 
 
             # Vocabulary: related organization
-            self.vocab_related_organization = UriLabelList(self.xml_uri_label(self.xml_all_elements(['.//{L}eventWrap/{L}eventSet/{L}event/{L}eventActor/{L}actorInRole/{L}actor[@{L}type="http://terminology.lido-schema.org/lido00165"]', './/{L}eventWrap/{L}eventSet/{L}event/{L}eventActor/{L}actorInRole/{L}actor[@{L}type="http://terminology.lido-schema.org/lido00166"]', './/{L}eventWrap/{L}eventSet/{L}event/{L}eventActor/{L}actorInRole/{L}actor[@{L}type="http://terminology.lido-schema.org/lido00413"]']), ['./{L}actorID[@{L}type="http://terminology.lido-schema.org/lido00099"]', './{L}actorID[@{L}type="uri"]'], './{L}nameActorSet/{L}appellationValue', True))
+            self.vocab_related_organization = UriLabelList(self.xml_uri_label(self.lido_actors(['http://terminology.lido-schema.org/lido00165', 'http://terminology.lido-schema.org/lido00166', 'http://terminology.lido-schema.org/lido00413']), ['./{L}actorID[@{L}type="http://terminology.lido-schema.org/lido00099"]', './{L}actorID[@{L}type="uri"]'], './{L}nameActorSet/{L}appellationValue', True))
 
             # Vocabulary: related person
             vocab_related_person = []
-            person = self.xml_uri_label(self.xml_all_elements('.//{L}eventWrap/{L}eventSet/{L}event/{L}eventActor/{L}actorInRole/{L}actor[@{L}type="http://terminology.lido-schema.org/lido00163"]'), ['./{L}actorID[@{L}type="http://terminology.lido-schema.org/lido00099"]', './{L}actorID[@{L}type="uri"]'], './{L}nameActorSet/{L}appellationValue', True)
+            person = self.xml_uri_label(self.lido_actors(['http://terminology.lido-schema.org/lido00163']), ['./{L}actorID[@{L}type="http://terminology.lido-schema.org/lido00099"]', './{L}actorID[@{L}type="uri"]'], './{L}nameActorSet/{L}appellationValue', True)
             if person != None:
                 vocab_related_person += person
             subject_person = self.xml_uri_label(self.xml_all_elements('.//{L}objectRelationWrap/{L}subjectWrap/{L}subjectSet/{L}subject/{L}subjectActor'), ['./{L}actor/{L}actorID[@{L}type="http://terminology.lido-schema.org/lido00099"]', './{L}actor/{L}actorID[@{L}type="uri"]'], './{L}displayActor', True)
@@ -235,40 +233,20 @@ class FeedElement(ExtractFeedElementInterface):
                 'Decor designed',
                 'Modelled',
             ]
-            events = self.xml_all_elements('.//{L}eventWrap/{L}eventSet/{L}event/{L}eventType/{L}term')
-            if events != None:
-                for event in events:
-                    if event.xpath('normalize-space(string())') in check_terms:
-                        try:
-                            self.creation_date = Date(date.fromisoformat(event.getparent().getparent().findtext('.//{http://www.lido-schema.org}eventDate/{http://www.lido-schema.org}date/{http://www.lido-schema.org}earliestDate')))
-                        except (ValueError, TypeError):
-                            pass
-            events = self.xml_all_elements('.//{L}eventWrap/{L}eventSet/{L}event/{L}eventType/{S}Concept/{S}prefLabel')
-            if events != None:
-                for event in events:
-                    if event.xpath('normalize-space(string())') in check_terms:
-                        try:
-                            self.creation_date = Date(date.fromisoformat(event.getparent().getparent().getparent().findtext('.//{http://www.lido-schema.org}eventDate/{http://www.lido-schema.org}date/{http://www.lido-schema.org}earliestDate')))
-                        except (ValueError, TypeError):
-                            pass
+            for event_type, event in self.lido_events:
+                if event_type in check_terms:
+                    try:
+                        self.creation_date = Date(date.fromisoformat(event.findtext('.//{http://www.lido-schema.org}eventDate/{http://www.lido-schema.org}date/{http://www.lido-schema.org}earliestDate')))
+                    except (ValueError, TypeError):
+                        pass
 
             # Creation period (check for specific event names, LIDO 1.0 and 1.1 notation)
-            events = self.xml_all_elements('.//{L}eventWrap/{L}eventSet/{L}event/{L}eventType/{L}term')
-            if events != None:
-                for event in events:
-                    if event.xpath('normalize-space(string())') in check_terms:
-                        try:
-                            self.creation_period = DateList(Literal(event.getparent().getparent().findtext('.//{http://www.lido-schema.org}eventDate/{http://www.lido-schema.org}displayDate'), lang = self.xml_lang(event.getparent().getparent().find('.//{http://www.lido-schema.org}eventDate/{http://www.lido-schema.org}displayDate'))))
-                        except ValueError:
-                            pass
-            events = self.xml_all_elements('.//{L}eventWrap/{L}eventSet/{L}event/{L}eventType/{S}Concept/{S}prefLabel')
-            if events != None:
-                for event in events:
-                    if event.xpath('normalize-space(string())') in check_terms:
-                        try:
-                            self.creation_period = DateList(Literal(event.getparent().getparent().getparent().findtext('.//{http://www.lido-schema.org}eventDate/{http://www.lido-schema.org}displayDate'), lang = self.xml_lang(event.getparent().getparent().getparent().find('.//{http://www.lido-schema.org}eventDate/{http://www.lido-schema.org}displayDate'))))
-                        except ValueError:
-                            pass
+            for event_type, event in self.lido_events:
+                if event_type in check_terms:
+                    try:
+                        self.creation_period = DateList(Literal(event.findtext('.//{http://www.lido-schema.org}eventDate/{http://www.lido-schema.org}displayDate'), lang = self.xml_lang(event.find('.//{http://www.lido-schema.org}eventDate/{http://www.lido-schema.org}displayDate'))))
+                    except ValueError:
+                        pass
 
             # Destruction date (check for specific event names, LIDO 1.0 and 1.1 notation)
             check_terms = [
@@ -279,22 +257,12 @@ class FeedElement(ExtractFeedElementInterface):
                 'Zerstörung',
                 'Destroyed'
             ]
-            events = self.xml_all_elements('.//{L}eventWrap/{L}eventSet/{L}event/{L}eventType/{L}term')
-            if events != None:
-                for event in events:
-                    if event.xpath('normalize-space(string())') in check_terms:
-                        try:
-                            self.destruction_date = Date(date.fromisoformat(event.getparent().getparent().findtext('.//{http://www.lido-schema.org}eventDate/{http://www.lido-schema.org}date/{http://www.lido-schema.org}latestDate')))
-                        except (ValueError, TypeError):
-                            pass
-            events = self.xml_all_elements('.//{L}eventWrap/{L}eventSet/{L}event/{L}eventType/{S}Concept/{S}prefLabel')
-            if events != None:
-                for event in events:
-                    if event.xpath('normalize-space(string())') in check_terms:
-                        try:
-                            self.destruction_date = Date(date.fromisoformat(event.getparent().getparent().getparent().findtext('.//{http://www.lido-schema.org}eventDate/{http://www.lido-schema.org}date/{http://www.lido-schema.org}latestDate')))
-                        except (ValueError, TypeError):
-                            pass
+            for event_type, event in self.lido_events:
+                if event_type in check_terms:
+                    try:
+                        self.destruction_date = Date(date.fromisoformat(event.findtext('.//{http://www.lido-schema.org}eventDate/{http://www.lido-schema.org}date/{http://www.lido-schema.org}latestDate')))
+                    except (ValueError, TypeError):
+                        pass
 
             # Approximate period
             #self.approximate_period = 
@@ -303,6 +271,98 @@ class FeedElement(ExtractFeedElementInterface):
             #self.existence_period = 
 
 
+    def lido_index(self):
+        '''
+        Collect resource representations and events of a LIDO record in a single pass
+        '''
+
+        # Vars
+        self.lido_resources:dict = {}
+        self.lido_events:list = []
+        self.lido_event_places:list = []
+        self.lido_event_actors:dict = {}
+        event_concepts = []
+
+        # Go through relevant nodes once
+        for element in self.file.xml.iter('{http://www.lido-schema.org}resourceRepresentation', '{http://www.lido-schema.org}event'):
+            parent = element.getparent()
+            if parent == None or parent.getparent() == None:
+                continue
+
+            # Remember first link of each resource type
+            if element.tag == '{http://www.lido-schema.org}resourceRepresentation':
+                if parent.tag == '{http://www.lido-schema.org}resourceSet' and parent.getparent().tag == '{http://www.lido-schema.org}resourceWrap':
+                    resource_type = element.get('{http://www.lido-schema.org}type')
+                    if resource_type != None and resource_type not in self.lido_resources:
+                        link = element.find('{http://www.lido-schema.org}linkResource')
+                        if link != None:
+                            self.lido_resources[resource_type] = link
+
+            # Remember event types as well as places and actors of each event
+            elif parent.tag == '{http://www.lido-schema.org}eventSet' and parent.getparent().tag == '{http://www.lido-schema.org}eventWrap':
+                for child in element:
+                    if child.tag == '{http://www.lido-schema.org}eventType':
+                        for term in child.iterchildren('{http://www.lido-schema.org}term'):
+                            self.lido_events.append((self.xml_text(term), element))
+                        for concept in child.iterchildren('{http://www.w3.org/2004/02/skos/core#}Concept'):
+                            for pref_label in concept.iterchildren('{http://www.w3.org/2004/02/skos/core#}prefLabel'):
+                                event_concepts.append((self.xml_text(pref_label), element))
+                    elif child.tag == '{http://www.lido-schema.org}eventPlace':
+                        self.lido_event_places.append(child)
+                    elif child.tag == '{http://www.lido-schema.org}eventActor':
+                        for actor in child.iterfind('{http://www.lido-schema.org}actorInRole/{http://www.lido-schema.org}actor'):
+                            actor_type = actor.get('{http://www.lido-schema.org}type')
+                            if actor_type not in self.lido_event_actors:
+                                self.lido_event_actors[actor_type] = []
+                            self.lido_event_actors[actor_type].append(actor)
+
+        # List LIDO 1.0 event types before LIDO 1.1 ones
+        self.lido_events += event_concepts
+
+
+    def lido_resource(self, resource_type:str) -> str|None:
+        '''
+        Get the first link of a LIDO resource representation type
+
+            Parameters:
+                resource_type (str): URI of the resource representation type
+
+            Returns:
+                str|None: Link to the resource
+        '''
+
+        # Return normalised text of the link
+        if resource_type in self.lido_resources:
+            link = self.xml_text(self.lido_resources[resource_type])
+            if link != '':
+                return link
+        return None
+
+
+    def lido_actors(self, actor_types:list) -> list|None:
+        '''
+        Get all event actors of the given LIDO actor types
+
+            Parameters:
+                actor_types (list): URIs of the actor types
+
+            Returns:
+                list|None: Actor elements
+        '''
+
+        # Combine actors of all types
+        actors = []
+        for actor_type in actor_types:
+            if actor_type in self.lido_event_actors:
+                actors += self.lido_event_actors[actor_type]
+
+        # Return result
+        if actors != []:
+            return actors
+        else:
+            return None
+
+
     def xml_all_lido_concepts(self, element_paths:str|list) -> list|None:
         '''
         Get all LIDO concept IDs in an XML tree according to both LIDO 1.0 and 1.1
@@ -315,15 +375,16 @@ class FeedElement(ExtractFeedElementInterface):
         '''
 
         # Get elements
-        element_paths = self.xml_paths(element_paths, True)
+        if isinstance(element_paths, str):
+            element_paths = [element_paths]
         concepts = []
 
         # Concepts according to LIDO 1.0
         for element_path in element_paths:
-            new_elements = self.file.xml.iterfind(element_path + '/{http://www.lido-schema.org}conceptID')
+            new_elements = self.xml_findall(self.file.xml, element_path + '/{L}conceptID')
             new_concepts = []
             for new_element in new_elements:
-                new_concept = new_element.xpath('normalize-space(string())')
+                new_concept = self.xml_text(new_element)
 
                 # Fix old Iconclass notations
                 if '{http://www.lido-schema.org}source' in new_element.attrib:
@@ -336,7 +397,7 @@ class FeedElement(ExtractFeedElementInterface):
 
         # Concept according to LIDO 1.1
         for element_path in element_paths:
-            new_concepts = [match.attrib['{http://www.w3.org/1999/02/22-rdf-syntax-ns#}about'] for match in self.file.xml.iterfind(element_path + '/{http://www.w3.org/2004/02/skos/core#}Concept[@{http://www.w3.org/1999/02/22-rdf-syntax-ns#}about]')]
+            new_concepts = [match.attrib['{http://www.w3.org/1999/02/22-rdf-syntax-ns#}about'] for match in self.xml_findall(self.file.xml, element_path + '/{S}Concept[@{http://www.w3.org/1999/02/22-rdf-syntax-ns#}about]')]
             concepts += new_concepts
 
         #Return unique results
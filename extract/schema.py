@@ -7,11 +7,14 @@
 
 
 # Import libraries
+from copy import copy
 from rdflib import Namespace
+from rdflib.term import BNode, Literal, URIRef
 
 # Import script modules
 from base.data import Uri, UriList, Label, LabelList, UriLabelList, Date, DateList, Media
 from base.extract import ExtractFeedInterface, ExtractFeedElementInterface
+from base.file import File, RdfIndex
 from base.lookup import schema_feed, schema_person, schema_organisation, schema_location, schema_structure, schema_event, schema_theater, schema_item, schema_book, schema_sculpture, schema_music
 
 # Define namespaces
@@ -39,7 +42,7 @@ class Feed(ExtractFeedInterface):
 
             # Retrieve first feed that contains data (feed and single-element notation)
             for feed_uri in feed_uris:
-                if not self.feed_uri and (self.rdf_all_triples(feed_uri, [SCHEMA.dataFeedElement, SDO.dataFeedElement, HYDRA.member], None, True) > 0 or self.rdf_all_triples(None, [SCHEMA.isPartOf, SDO.isPartOf], feed_uri, True) > 0):
+                if not self.feed_uri and feed_uri == feed_with_data(self, feed_uris, [SCHEMA.dataFeedElement, SDO.dataFeedElement, HYDRA.member]):
 
                     # Feed URI
                     self.feed_uri = Uri(feed_uri, normalize = False)
@@ -55,6 +58,7 @@ class Feed(ExtractFeedInterface):
                         if pagination_next and pagination_last:
                             if pagination_current != pagination_last:
                                 self.feed_uri_next = Uri(pagination_next, normalize = False)
+                                self.feed_uri_last = Uri(pagination_last, normalize = False)
 
                     # Catalog URI
                     self.catalog_uri = Uri(self.rdf_first_object(self.feed_uri.rdflib(), [SCHEMA.includedInDataCatalog, SDO.includedInDataCatalog]), normalize = False)
@@ -70,7 +74,7 @@ class Feed(ExtractFeedInterface):
                     wrappers = self.rdf_all_objects(self.feed_uri.rdflib(), [SCHEMA.dataFeedElement, SDO.dataFeedElement])
                     if wrappers != None:
                         for wrapper in wrappers:
-                            if (wrapper, RDF.type, SCHEMA.DataFeedItem) in self.file.rdf or (wrapper, RDF.type, SDO.DataFeedItem) in self.file.rdf:
+                            if self.rdf_exists(wrapper, RDF.type, [SCHEMA.DataFeedItem, SDO.DataFeedItem]):
                                 self.element_uris.append(self.rdf_first_object(wrapper, [SCHEMA.item, SDO.item]))
                     elements = self.rdf_all_subjects([SCHEMA.isPartOf, SDO.isPartOf], self.feed_uri.rdflib())
                     if elements != None:
@@ -82,10 +86,76 @@ class Feed(ExtractFeedInterface):
                             self.element_uris.append(element)
                     self.element_uris = list(set(self.element_uris))
 
-                    # Feed elements
+                    # Feed elements, each extracted from its own slice of the graph
                     if self.elements_in_feed:
+                        skip = set(self.element_uris)
+                        skip.add(self.feed_uri.rdflib())
+                        feed_context = self.feed_context(skip)
                         for element_uri in self.element_uris:
-                            self.feed_elements.append(FeedElement(self.file, self.feed_uri.uri, element_uri))
+                            self.feed_elements.append(FeedElement(self.element_file(element_uri, feed_context, skip), self.feed_uri.uri, element_uri))
+
+
+    def feed_context(self, skip:set) -> dict:
+        '''
+        Describe the feed without its elements, to add to each element slice
+
+            Parameters:
+                skip (set): Feed and element nodes to leave out
+
+            Returns:
+                dict: Subjects with unified predicates and ordered dicts of objects
+        '''
+
+        # Leave out links to elements
+        index = self.file.rdf_index()
+        feed_uri = self.feed_uri.rdflib()
+        feed_description = {}
+        for pre, objs in index.subject_index(feed_uri).items():
+            if pre not in [SCHEMA.dataFeedElement, HYDRA.member]:
+                feed_description[pre] = objs
+
+        # Describe what the feed refers to, like its catalog
+        output = {}
+        for objs in feed_description.values():
+            for obj in objs:
+                if obj not in skip and not isinstance(obj, Literal):
+                    output.update(index.describe(obj, skip))
+        output[feed_uri] = feed_description
+
+        # Return descriptions
+        return output
+
+
+    def element_file(self, element_uri:BNode|URIRef|None, feed_context:dict, skip:set) -> File:
+        '''
+        Provide a copy of the feed file that only queries the triples of a single element
+
+            Parameters:
+                element_uri (BNode|URIRef|None): Element to describe
+                feed_context (dict): Description of the feed to add
+                skip (set): Feed and element nodes to leave out
+
+            Returns:
+                File: Copy of the file with an index of the element slice
+        '''
+
+        # Keep whole file if there is nothing to slice
+        if element_uri == None:
+            return self.file
+
+        # Describe element and the named nodes it refers to, but not the feed or other elements beyond their own triples
+        index = self.file.rdf_index()
+        descriptions = dict(feed_context)
+        for node, description in index.describe(element_uri, skip, True).items():
+            if node not in descriptions:
+                descriptions[node] = description
+
+        # Set up file copy with slice index
+        output = copy(self.file)
+        output.index = RdfIndex(self.file.rdf, descriptions)
+
+        # Return file
+        return output
 
 
 class FeedElement(ExtractFeedElementInterface):
@@ -104,7 +174,7 @@ class FeedElement(ExtractFeedElementInterface):
 
             # Retrieve indicated feed or first feed that contains data (feed and single-element notation)
             for feed_uri in feed_uris:
-                if str(feed_uri) == self.feed_uri.uri or (not self.feed_uri and (self.rdf_all_triples(feed_uri, [SCHEMA.dataFeedElement, SDO.dataFeedElement], None, True) > 0 or self.rdf_all_triples(None, [SCHEMA.isPartOf, SDO.isPartOf], feed_uri, True) > 0)):
+                if str(feed_uri) == self.feed_uri.uri or (not self.feed_uri and feed_uri == feed_with_data(self, feed_uris, [SCHEMA.dataFeedElement, SDO.dataFeedElement])):
 
                     # Feed URI (if it has not been set)
                     if not self.feed_uri:
@@ -123,7 +193,7 @@ class FeedElement(ExtractFeedElementInterface):
                     if not self.element_uri:
                         wrapper = self.rdf_first_object(self.feed_uri.rdflib(), [SCHEMA.dataFeedElement, SDO.dataFeedElement])
                         if wrapper != None:
-                            if (wrapper, RDF.type, SCHEMA.DataFeedItem) in self.file.rdf or (wrapper, RDF.type, SDO.DataFeedItem) in self.file.rdf:
+                            if self.rdf_exists(wrapper, RDF.type, [SCHEMA.DataFeedItem, SDO.DataFeedItem]):
                                 self.element_uri = Uri(self.rdf_first_object(wrapper, [SCHEMA.item, SDO.item]))
                         if not self.element_uri:
                             self.element_uri = Uri(self.rdf_first_subject([SCHEMA.isPartOf, SDO.isPartOf], self.feed_uri.rdflib()), normalize = False)
@@ -352,3 +422,30 @@ class FeedElement(ExtractFeedElementInterface):
 
                     # Existence period (if CTO v2 or v3 used in schema.org)
                     self.existence_period = DateList(self.rdf_all_objects(self.element_uri.rdflib(), [CTO2.existencePeriod, CTO3.CTO_0001075])) # has existence period
+
+
+def feed_with_data(extract:ExtractFeedInterface|ExtractFeedElementInterface, feed_uris:list, member_predicates:list) -> BNode|URIRef|None:
+    '''
+    Find the first feed that has members or elements pointing to it, resolved once per parsed file
+
+        Parameters:
+            extract (ExtractFeedInterface|ExtractFeedElementInterface): Extract to query
+            feed_uris (list): Candidate feed nodes
+            member_predicates (list): Predicates linking a feed to its members
+
+        Returns:
+            BNode|URIRef|None: Feed node or None if no feed contains data
+    '''
+
+    # Check candidates if not done for this file yet
+    cache = extract.file.rdf_index().cache
+    key = ('feed', frozenset(feed_uris), tuple(member_predicates))
+    if key not in cache:
+        cache[key] = None
+        for feed_uri in feed_uris:
+            if extract.rdf_exists(feed_uri, member_predicates, None) or extract.rdf_exists(None, [SCHEMA.isPartOf, SDO.isPartOf], feed_uri):
+                cache[key] = feed_uri
+                break
+
+    # Return feed node
+    return cache[key]
@@ -8,6 +8,8 @@
 
 # Import libraries
 import logging
+from csv import QUOTE_ALL, writer
+from io import StringIO, TextIOBase
 
 # Import script modules
 from base.map import MapFeedInterface, MapFeedElementInterface
@@ -15,6 +17,49 @@ from base.map import MapFeedInterface, MapFeedElementInterface
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Columns of the CSV table
+columns:list = [
+    'feed_uri',
+    'element_uri',
+    'element_uri_same',
+    'element_type',
+    'element_type_short',
+    'data_concept_short',
+    'label',
+    'label_alt',
+    'holding_org',
+    'shelf_mark',
+    'media',
+    'lyrics',
+    'teaser',
+    'incipit',
+    'source_file',
+    'source_type_short',
+    'publisher',
+    'license',
+    'byline',
+    'vocab_element_type', # Deprecated, remove along with CTO2
+    'vocab_subject_concept', # Deprecated, remove along with CTO2
+    'vocab_classifier',
+    'vocab_related_location',
+    'vocab_related_event',
+    'vocab_related_organization',
+    'vocab_related_person',
+    'vocab_further',
+    'related_item',
+    'birth_date',
+    'death_date',
+    'foundation_date',
+    'dissolution_date',
+    'start_date',
+    'end_date',
+    'creation_date',
+    'creation_period',
+    'destruction_date',
+    'approximate_period',
+    'existence_period'
+]
+
 
 class Feed(MapFeedInterface):
 
@@ -30,65 +75,58 @@ class Feed(MapFeedInterface):
         # Set file extension
         self.file_extension = 'csv'
 
-        # Basic set-up
-        self.content = csv('feed_uri')
-        self.content += csv('element_uri')
-        self.content += csv('element_uri_same')
-        self.content += csv('element_type')
-        self.content += csv('element_type_short')
-        self.content += csv('data_concept_short')
-        self.content += csv('label')
-        self.content += csv('label_alt')
-        self.content += csv('holding_org')
-        self.content += csv('shelf_mark')
-        self.content += csv('media')
-        self.content += csv('lyrics')
-        self.content += csv('teaser')
-        self.content += csv('incipit')
-        self.content += csv('source_file')
-        self.content += csv('source_type_short')
-        self.content += csv('publisher')
-        self.content += csv('license')
-        self.content += csv('byline')
-        self.content += csv('vocab_element_type') # Deprecated, remove along with CTO2
-        self.content += csv('vocab_subject_concept') # Deprecated, remove along with CTO2
-        self.content += csv('vocab_classifier')
-        self.content += csv('vocab_related_location')
-        self.content += csv('vocab_related_event')
-        self.content += csv('vocab_related_organization')
-        self.content += csv('vocab_related_person')
-        self.content += csv('vocab_further')
-        self.content += csv('related_item')
-        self.content += csv('birth_date')
-        self.content += csv('death_date')
-        self.content += csv('foundation_date')
-        self.content += csv('dissolution_date')
-        self.content += csv('start_date')
-        self.content += csv('end_date')
-        self.content += csv('creation_date')
-        self.content += csv('creation_period')
-        self.content += csv('destruction_date')
-        self.content += csv('approximate_period')
-        self.content += csv('existence_period', last = True)
-
-        # Add line break if there are elements
-        if self.feed_elements:
-            self.content += '\n'
-
-        # Add elements
-        for i, e in enumerate(self.feed_elements):
-            o = FeedElement(e)
-            o.generate(prepare)
-            self.content += o.content
-
-            # Add line break if not the last element
-            if i + 1 != len(self.feed_elements):
-                self.content += '\n'
+        # Write table to a string
+        content = StringIO()
+        self.write(content, prepare)
+        self.content = content.getvalue()
 
         # Show that the data is stored
         self.success = True
 
 
+    def save(self, file_path:str, format:str|None = None, prepare:list|None = None):
+        '''
+        Stream the CSV table of the feed to a file
+
+            Parameters:
+                file_path (str): Path of the file to create
+                format (str|None): Not used for CSV tables
+                prepare (list|None): Prepare cto output for this NFDI4Culture feed and catalog ID
+        '''
+
+        # Write table row by row
+        self.file_extension = 'csv'
+        file_path = file_path + '.' + self.file_extension
+        with open(file_path, 'w', newline = '') as f:
+            self.write(f, prepare)
+
+        # Log info
+        logger.info('Mapped data to file ' + file_path)
+
+
+    def write(self, f:TextIOBase, prepare:list|None = None):
+        '''
+        Write the header and a row per feed element
+
+            Parameters:
+                f (TextIOBase): Text file or buffer to write to
+                prepare (list|None): Prepare cto output for this NFDI4Culture feed and catalog ID
+        '''
+
+        # Header
+        table = table_writer(f)
+        table.writerow(columns)
+
+        # Add elements, separated by line breaks
+        for e in self.feed_elements:
+            o = FeedElement(e)
+            if not o.element_uri:
+                logger.error('Feed element URI missing')
+            else:
+                f.write('\n')
+                table.writerow(o.row())
+
+
 class FeedElement(MapFeedElementInterface):
 
 
@@ -107,160 +145,169 @@ class FeedElement(MapFeedElementInterface):
         if not self.element_uri:
             logger.error('Feed element URI missing')
         else:
-            self.content = ''
 
+            # Write row to a string
+            content = StringIO()
+            table_writer(content).writerow(self.row())
+            self.content = content.getvalue()
+
+            # Show that the data is stored
+            self.success = True
+
+
+    def row(self) -> list:
+        '''
+        Compile the table row of the feed element
+
+            Returns:
+                list: Cell contents in the order of the header
+        '''
+
+        # Return cells
+        return [
             # ELEMENT
 
             # Feed URI
-            self.content += csv(self.feed_uri.text())
+            self.feed_uri.text(),
 
             # Element URI
-            self.content += csv(self.element_uri.text())
+            self.element_uri.text(),
 
             # Same as element URI
-            self.content += csv(self.element_uri_same.text())
+            self.element_uri_same.text(),
 
             # Element type
-            self.content += csv(self.element_type.text())
-            
+            self.element_type.text(),
+
             # Element type shorthand
-            self.content += csv(self.element_type_short)
+            self.element_type_short,
 
             # Data concept shorthand
-            self.content += csv('; '.join(str(dcs) for dcs in self.data_concept_short))
+            '; '.join(str(dcs) for dcs in self.data_concept_short),
 
             # LABEL AND REFERENCE LITERALS
 
             # Main label
-            self.content += csv(self.label.text())
+            self.label.text(),
 
             # Alternative label
-            self.content += csv(self.label_alt.text())
+            self.label_alt.text(),
 
             # Holding organization
-            self.content += csv(self.holding_org.text())
+            self.holding_org.text(),
 
             # Shelf mark
-            self.content += csv(self.shelf_mark.text())
+            self.shelf_mark.text(),
 
             # MEDIA LITERALS
 
             # Media
-            self.content += csv(self.media.text())
+            self.media.text(),
 
             # Lyrics
-            self.content += csv(self.lyrics.text())
+            self.lyrics.text(),
 
             # Teaser
-            self.content += csv(self.teaser.text())
+            self.teaser.text(),
 
             # Incipit
-            self.content += csv(self.incipit.text())
+            self.incipit.text(),
 
             # Source file
-            self.content += csv(self.source_file.text())
+            self.source_file.text(),
 
             # Source type_short
-            self.content += csv('; '.join(str(sts) for sts in self.source_type_short))
+            '; '.join(str(sts) for sts in self.source_type_short),
 
             # RIGHTS URIS
 
             # Publisher
-            self.content += csv(self.publisher.text())
+            self.publisher.text(),
 
             # License
-            self.content += csv(self.license.text())
+            self.license.text(),
 
             # Byline
-            self.content += csv(self.byline.text())
+            self.byline.text(),
 
             # RELATED URIS AND FALLBACK LITERALS
 
             # Element type
             # Deprecated, remove along with CTO2
-            self.content += csv(self.vocab_element_type.text())
+            self.vocab_element_type.text(),
 
             # Subject concept
             # Deprecated, remove along with CTO2
-            self.content += csv(self.vocab_subject_concept.text())
+            self.vocab_subject_concept.text(),
 
             # Classifier
-            self.content += csv(self.vocab_classifier.text())
+            self.vocab_classifier.text(),
 
             # Related location
-            self.content += csv(self.vocab_related_location.text())
+            self.vocab_related_location.text(),
 
             # Related event
-            self.content += csv(self.vocab_related_event.text())
+            self.vocab_related_event.text(),
 
             # Related organization
-            self.content += csv(self.vocab_related_organization.text())
+            self.vocab_related_organization.text(),
 
             # Related person
-            self.content += csv(self.vocab_related_person.text())
+            self.vocab_related_person.text(),
 
             # Further vocabularies
-            self.content += csv(self.vocab_further.text())
+            self.vocab_further.text(),
 
             # Related item
-            self.content += csv(self.related_item.text())
+            self.related_item.text(),
 
             # DATES BY TYPE
 
             # Birth date
-            self.content += csv(self.birth_date.text())
+            self.birth_date.text(),
 
             # Death date
-            self.content += csv(self.death_date.text())
+            self.death_date.text(),
 
             # Foundation date
-            self.content += csv(self.foundation_date.text())
+            self.foundation_date.text(),
 
             # Dissolution date
-            self.content += csv(self.dissolution_date.text())
+            self.dissolution_date.text(),
 
             # Start date
-            self.content += csv(self.start_date.text())
+            self.start_date.text(),
 
             # End date
-            self.content += csv(self.end_date.text())
+            self.end_date.text(),
 
             # Creation date
-            self.content += csv(self.creation_date.text())
+            self.creation_date.text(),
 
             # Creation period
-            self.content += csv(self.creation_period.text())
+            self.creation_period.text(),
 
             # Destruction date
-            self.content += csv(self.destruction_date.text())
+            self.destruction_date.text(),
 
             # Approximate period
-            self.content += csv(self.approximate_period.text())
+            self.approximate_period.text(),
 
             # Existence period
-            self.content += csv(self.existence_period.text(), last = True)
+            self.existence_period.text()
+        ]
 
-            # Show that the data is stored
-            self.success = True
 
-
-def csv(input:str, last:bool = False) -> str:
+def table_writer(f:TextIOBase) -> any:
     '''
-    Surround string with quotation marks and add a comma
+    Set up a CSV writer that quotes every cell and leaves line breaks to the caller
 
         Parameters:
-            input (str): String to surround with commas
-            last (bool): Marker to decide whether to add a comma
+            f (TextIOBase): Text file or buffer to write to
 
         Returns:
-            str: Quoted string
+            any: CSV writer object
     '''
 
-    # Set up new string
-    input = input.replace('"', '\"')
-    input = '"' + input + '"'
-    if not last:
-        input += ','
-
-    # Return string
-    return input
+    # Quote all cells, double embedded quotation marks
+    return writer(f, quoting = QUOTE_ALL, lineterminator = '')
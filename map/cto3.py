@@ -9,13 +9,14 @@
 # Import libraries
 import logging
 from datetime import date
+from functools import lru_cache
 from hashlib import sha256
 from rdflib import Graph, Namespace
 from rdflib.term import BNode, Literal, URIRef
 from collections import defaultdict
 
 # Import script modules
-from base.map import MapFeedInterface, MapFeedElementInterface
+from base.map import MapFeedInterface, MapFeedElementInterface, NTriples
 
 # Define namespaces
 from rdflib.namespace import OWL, RDF, RDFS, XSD
@@ -68,7 +69,7 @@ class Feed(MapFeedInterface):
         if not self.feed_uri:
             logger.error('Feed URI missing')
         else:
-            self.rdf = namespaces()
+            self.rdf = NTriples(namespace_bindings())
 
             # Feed URI
             if prepare != None and len(prepare) >= 2:
@@ -107,12 +108,12 @@ class Feed(MapFeedInterface):
                 for i in self.catalog_uri_same.rdflib():
                     self.rdf.add((catalog_uri, SCHEMA.sameAs, i))
 
-            # Add element triples after overwriting feed URI
+            # Add element triples to the feed triples after overwriting feed URI
             for i in self.feed_elements:
                 o = FeedElement(i)
                 o.feed_uri = self.feed_uri
+                o.rdf = self.rdf
                 o.generate(prepare)
-                self.rdf += o.rdf
 
             # Show that the data is stored
             self.success = True
@@ -137,7 +138,8 @@ class FeedElement(MapFeedElementInterface):
         elif len(prepare) == 2 and not self.license:
             logger.warning('No license attached to feed element')
         else:
-            self.rdf = namespaces()
+            if self.rdf == None:
+                self.rdf = NTriples(namespace_bindings())
 
 
             # TODO Open questions:
@@ -677,6 +679,19 @@ def namespaces() -> Graph:
     return output
 
 
+@lru_cache(maxsize = 1)
+def namespace_bindings() -> tuple:
+    '''
+    Provide all required namespaces once as immutable prefix and namespace pairs
+
+        Returns:
+            tuple: Prefixes and namespaces of a basic graph object
+    '''
+
+    # Collect namespaces a single time
+    return tuple(namespaces().namespaces())
+
+
 def element_ark(element_uri:str, prepare_feed:str) -> URIRef:
     '''
     Generate an NFDI4Culture ARK ID for the wrapper of a data feed element
@@ -0,0 +1,435 @@
+# Generate a typed Parquet table
+#
+# This file is part of the Hydra Scraper package.
+#
+# For the full copyright and license information, please read the
+# LICENSE.txt file that was distributed with this source code.
+
+
+# Import libraries
+import logging
+import pyarrow
+from pyarrow.parquet import ParquetWriter
+
+# Import script modules
+from base.data import Uri, UriList, LabelList, UriLabelList, Date, DateList, Incipit, Media
+from base.map import MapFeedInterface, MapFeedElementInterface
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Column types for single and multiple values
+labels_type = pyarrow.list_(pyarrow.struct([
+    ('label', pyarrow.string()),
+    ('language', pyarrow.string())
+]))
+uri_labels_type = pyarrow.list_(pyarrow.struct([
+    ('uri', pyarrow.string()),
+    ('labels', labels_type)
+]))
+strings_type = pyarrow.list_(pyarrow.string())
+
+# Columns of the Parquet table, in the same order as the CSV table
+columns = pyarrow.schema([
+    ('feed_uri', pyarrow.string()),
+    ('element_uri', pyarrow.string()),
+    ('element_uri_same', strings_type),
+    ('element_type', pyarrow.string()),
+    ('element_type_short', pyarrow.string()),
+    ('data_concept_short', strings_type),
+    ('label', labels_type),
+    ('label_alt', labels_type),
+    ('holding_org', pyarrow.string()),
+    ('shelf_mark', labels_type),
+    ('media', pyarrow.struct([
+        ('uri', pyarrow.string()),
+        ('type', pyarrow.string()),
+        ('license', uri_labels_type),
+        ('byline', labels_type)
+    ])),
+    ('lyrics', labels_type),
+    ('teaser', labels_type),
+    ('incipit', pyarrow.struct([
+        ('uri', pyarrow.string()),
+        ('clef', pyarrow.string()),
+        ('key', pyarrow.string()),
+        ('key_sig', pyarrow.string()),
+        ('time_sig', pyarrow.string()),
+        ('pattern', pyarrow.string())
+    ])),
+    ('source_file', pyarrow.string()),
+    ('source_type_short', strings_type),
+    ('publisher', strings_type),
+    ('license', uri_labels_type),
+    ('byline', labels_type),
+    ('vocab_element_type', uri_labels_type), # Deprecated, remove along with CTO2
+    ('vocab_subject_concept', uri_labels_type), # Deprecated, remove along with CTO2
+    ('vocab_classifier', uri_labels_type),
+    ('vocab_related_location', uri_labels_type),
+    ('vocab_related_event', uri_labels_type),
+    ('vocab_related_organization', uri_labels_type),
+    ('vocab_related_person', uri_labels_type),
+    ('vocab_further', uri_labels_type),
+    ('related_item', strings_type),
+    ('birth_date', pyarrow.string()),
+    ('death_date', pyarrow.string()),
+    ('foundation_date', pyarrow.string()),
+    ('dissolution_date', pyarrow.string()),
+    ('start_date', pyarrow.string()),
+    ('end_date', pyarrow.string()),
+    ('creation_date', pyarrow.string()),
+    ('creation_period', strings_type),
+    ('destruction_date', pyarrow.string()),
+    ('approximate_period', strings_type),
+    ('existence_period', strings_type)
+])
+
+
+class Table:
+
+
+    def __init__(self, file_path:str, row_group_size:int = 10000, compression:str|None = None, compression_level:int|None = None):
+        '''
+        Write rows to a Parquet file in row groups to keep memory use bounded
+
+            Parameters:
+                file_path (str): Path of the file to create
+                row_group_size (int): Number of rows to collect before writing them
+                compression (str|None): Column compression to use instead of Snappy, 'gzip' or 'zstd'
+                compression_level (int|None): Compression level
+        '''
+
+        # Vars
+        self.file_path:str = file_path
+        self.row_group_size:int = row_group_size
+        self.rows:list = []
+        self.writer:ParquetWriter = ParquetWriter(file_path, columns, compression = compression or 'snappy', compression_level = compression_level)
+
+
+    def add(self, rows:list):
+        '''
+        Add rows and write a row group once enough are collected
+
+            Parameters:
+                rows (list): Rows as dictionaries keyed by column name
+        '''
+
+        # Collect rows
+        self.rows += rows
+        if len(self.rows) >= self.row_group_size:
+            self.flush()
+
+
+    def flush(self):
+        '''
+        Write collected rows as a row group
+        '''
+
+        # Write and forget rows
+        if len(self.rows) > 0:
+            self.writer.write_table(pyarrow.Table.from_pylist(self.rows, schema = columns))
+            self.rows = []
+
+
+    def close(self):
+        '''
+        Write remaining rows and finish the file
+        '''
+
+        # Flush and close
+        self.flush()
+        self.writer.close()
+
+        # Log info
+        logger.info('Saved Parquet table ' + self.file_path)
+
+
+class Feed(MapFeedInterface):
+
+
+    def generate(self, prepare:list|None = None):
+        '''
+        Generate Parquet rows of the feed elements and fill the rows attribute
+
+            Parameters:
+                prepare (list|None): Prepare cto output for this NFDI4Culture feed and catalog ID
+        '''
+
+        # Set file extension
+        self.file_extension = 'parquet'
+
+        # Add elements
+        self.rows:list = []
+        for e in self.feed_elements:
+            o = FeedElement(e)
+            o.generate(prepare)
+            self.rows += o.rows
+
+        # Show that the data is stored
+        self.success = True
+
+
+    def save(self, file_path:str, format:str|None = None, prepare:list|None = None):
+        '''
+        Save rows as a Parquet file
+
+            Parameters:
+                file_path (str): Path of the file to create
+                format (str|None): Not used for Parquet tables
+                prepare (list|None): Prepare cto output for this NFDI4Culture feed and catalog ID
+        '''
+
+        # Write rows
+        save_rows(self, file_path, prepare)
+
+
+class FeedElement(MapFeedElementInterface):
+
+
+    def generate(self, prepare:list|None = None):
+        '''
+        Generate a Parquet row of the feed element and fill the rows attribute
+
+            Parameters:
+                prepare (list|None): Prepare cto output for this NFDI4Culture feed and catalog ID
+        '''
+
+        # Set file extension
+        self.file_extension = 'parquet'
+
+        # Check requirements
+        self.rows:list = []
+        if not self.element_uri:
+            logger.error('Feed element URI missing')
+        else:
+            self.rows.append({
+
+                # ELEMENT
+                'feed_uri': uri(self.feed_uri),
+                'element_uri': uri(self.element_uri),
+                'element_uri_same': uris(self.element_uri_same),
+                'element_type': uri(self.element_type),
+                'element_type_short': self.element_type_short or None,
+                'data_concept_short': sorted(str(dcs) for dcs in self.data_concept_short),
+
+                # LABEL AND REFERENCE LITERALS
+                'label': labels(self.label),
+                'label_alt': labels(self.label_alt),
+                'holding_org': uri(self.holding_org),
+                'shelf_mark': labels(self.shelf_mark),
+
+                # MEDIA LITERALS
+                'media': media(self.media),
+                'lyrics': labels(self.lyrics),
+                'teaser': labels(self.teaser),
+                'incipit': incipit(self.incipit),
+                'source_file': self.source_file.label,
+                'source_type_short': sorted(str(sts) for sts in self.source_type_short),
+
+                # RIGHTS URIS
+                'publisher': uris(self.publisher),
+                'license': uri_labels(self.license),
+                'byline': labels(self.byline),
+
+                # RELATED URIS AND FALLBACK LITERALS
+                'vocab_element_type': uri_labels(self.vocab_element_type), # Deprecated, remove along with CTO2
+                'vocab_subject_concept': uri_labels(self.vocab_subject_concept), # Deprecated, remove along with CTO2
+                'vocab_classifier': uri_labels(self.vocab_classifier),
+                'vocab_related_location': uri_labels(self.vocab_related_location),
+                'vocab_related_event': uri_labels(self.vocab_related_event),
+                'vocab_related_organization': uri_labels(self.vocab_related_organization),
+                'vocab_related_person': uri_labels(self.vocab_related_person),
+                'vocab_further': uri_labels(self.vocab_further),
+                'related_item': uris(self.related_item),
+
+                # DATES BY TYPE
+                'birth_date': single_date(self.birth_date),
+                'death_date': single_date(self.death_date),
+                'foundation_date': single_date(self.foundation_date),
+                'dissolution_date': single_date(self.dissolution_date),
+                'start_date': single_date(self.start_date),
+                'end_date': single_date(self.end_date),
+                'creation_date': single_date(self.creation_date),
+                'creation_period': dates(self.creation_period),
+                'destruction_date': single_date(self.destruction_date),
+                'approximate_period': dates(self.approximate_period),
+                'existence_period': dates(self.existence_period)
+            })
+
+            # Show that the data is stored
+            self.success = True
+
+
+    def save(self, file_path:str, format:str|None = None, prepare:list|None = None):
+        '''
+        Save the row as a Parquet file
+
+            Parameters:
+                file_path (str): Path of the file to create
+                format (str|None): Not used for Parquet tables
+                prepare (list|None): Prepare cto output for this NFDI4Culture feed and catalog ID
+        '''
+
+        # Write rows
+        save_rows(self, file_path, prepare)
+
+
+def save_rows(mapped:Feed|FeedElement, file_path:str, prepare:list|None = None):
+    '''
+    Generate rows if necessary and save them as a single Parquet file
+
+        Parameters:
+            mapped (Feed|FeedElement): Mapped feed or feed element
+            file_path (str): Path of the file to create, without extension
+            prepare (list|None): Prepare cto output for this NFDI4Culture feed and catalog ID
+    '''
+
+    # Generate rows
+    if not mapped.success:
+        mapped.generate(prepare)
+
+    # Write table
+    table = Table(file_path + '.' + mapped.file_extension)
+    table.add(mapped.rows)
+    table.close()
+
+
+def uri(input:Uri) -> str|None:
+    '''
+    Provide a URI as a string column value
+
+        Parameters:
+            input (Uri): URI node
+
+        Returns:
+            str|None: URI or None if empty
+    '''
+
+    # Return URI
+    return input.uri
+
+
+def uris(input:UriList) -> list:
+    '''
+    Provide URIs as a list column value
+
+        Parameters:
+            input (UriList): List of URI nodes
+
+        Returns:
+            list: URIs
+    '''
+
+    # Return URIs
+    return [i.uri for i in input.uris]
+
+
+def labels(input:LabelList) -> list:
+    '''
+    Provide labels and their languages as a list column value
+
+        Parameters:
+            input (LabelList): List of string literal nodes
+
+        Returns:
+            list: Labels as dictionaries
+    '''
+
+    # Return labels
+    return [{'label': i.label, 'language': i.language} for i in input.labels]
+
+
+def uri_labels(input:UriLabelList) -> list:
+    '''
+    Provide URIs with their labels as a list column value
+
+        Parameters:
+            input (UriLabelList): List of URI nodes with labels
+
+        Returns:
+            list: URIs and labels as dictionaries
+    '''
+
+    # Return URIs and labels
+    return [{'uri': i.uri.uri, 'labels': labels(i.labels)} for i in input.uri_labels]
+
+
+def single_date(input:Date) -> str|None:
+    '''
+    Provide a date, datetime, range, or date label as a string column value
+
+        Parameters:
+            input (Date): Date literal node
+
+        Returns:
+            str|None: ISO 8601 string or label, None if empty
+    '''
+
+    # Return date text
+    if input:
+        return input.text()
+    else:
+        return None
+
+
+def dates(input:DateList) -> list:
+    '''
+    Provide dates as a list column value
+
+        Parameters:
+            input (DateList): List of date literal nodes
+
+        Returns:
+            list: ISO 8601 strings or labels
+    '''
+
+    # Return date texts
+    return [i.text() for i in input.dates]
+
+
+def media(input:Media) -> dict|None:
+    '''
+    Provide media data as a struct column value
+
+        Parameters:
+            input (Media): Media node
+
+        Returns:
+            dict|None: Media data or None if empty
+    '''
+
+    # Return media data
+    if input:
+        return {
+            'uri': input.uri.uri,
+            'type': input.type or None,
+            'license': uri_labels(input.license),
+            'byline': labels(input.byline)
+        }
+    else:
+        return None
+
+
+def incipit(input:Incipit) -> dict|None:
+    '''
+    Provide incipit data as a struct column value
+
+        Parameters:
+            input (Incipit): Incipit node
+
+        Returns:
+            dict|None: Incipit data or None if empty
+    '''
+
+    # Return incipit data
+    if input:
+        return {
+            'uri': input.uri.uri,
+            'clef': input.clef.label,
+            'key': input.key.label,
+            'key_sig': input.key_sig.label,
+            'time_sig': input.time_sig.label,
+            'pattern': input.pattern.label
+        }
+    else:
+        return None
@@ -33,6 +33,7 @@ tests = [
     'lido-element-b',
     'schema-feed-a',
     'schema-feed-b',
+    'schema-feed-c',
     'schema-element-a',
     'lookup'
 ]
@@ -44,6 +45,7 @@ if 'beacon-feed-a' in tests:
     #print(extract)
     extract.map_and_save('beacon', 'downloads/test-beacon-feed-a')
     extract.map_and_save('csv', 'downloads/test-beacon-feed-a')
+    extract.map_and_save('parquet', 'downloads/test-beacon-feed-a')
     extract.map_and_turtle('cto', 'downloads/test-beacon-feed-a')
 
 # Beacon feed B
@@ -53,6 +55,7 @@ if 'beacon-feed-b' in tests:
     #print(extract)
     extract.map_and_save('beacon', 'downloads/test-beacon-feed-b')
     extract.map_and_save('csv', 'downloads/test-beacon-feed-b')
+    extract.map_and_save('parquet', 'downloads/test-beacon-feed-b')
     extract.map_and_turtle('cto', 'downloads/test-beacon-feed-b')
 
 # CMIF feed A
@@ -62,6 +65,7 @@ if 'cmif-feed-a' in tests:
     #print(extract)
     extract.map_and_save('beacon', 'downloads/test-cmif-feed-a')
     extract.map_and_save('csv', 'downloads/test-cmif-feed-a')
+    extract.map_and_save('parquet', 'downloads/test-cmif-feed-a')
     extract.map_and_turtle('cto', 'downloads/test-cmif-feed-a')
 
 # LIDO feed element A
@@ -87,6 +91,7 @@ if 'schema-feed-a' in tests:
     #print(extract)
     extract.map_and_save('beacon', 'downloads/test-schema-feed-a')
     extract.map_and_save('csv', 'downloads/test-schema-feed-a')
+    extract.map_and_save('parquet', 'downloads/test-schema-feed-a')
     extract.map_and_turtle('cto', 'downloads/test-schema-feed-a', prepare = ['E1234', 'E5678'])
 
 # Schema.org feed and elements B
@@ -96,8 +101,30 @@ if 'schema-feed-b' in tests:
     #print(extract)
     extract.map_and_save('beacon', 'downloads/test-schema-feed-b')
     extract.map_and_save('csv', 'downloads/test-schema-feed-b')
+    extract.map_and_save('parquet', 'downloads/test-schema-feed-b')
     extract.map_and_turtle('cto', 'downloads/test-schema-feed-b')
 
+# Schema.org feed and elements C, referring to each other
+if 'schema-feed-c' in tests:
+    with open('downloads/test-schema-feed-c.ttl', 'w') as f:
+        f.write('''@prefix schema: <http://schema.org/> .
+<https://example.org/feed> a schema:DataFeed ;
+    schema:dataFeedElement [ a schema:DataFeedItem ; schema:item <https://example.org/work/1> ] , [ a schema:DataFeedItem ; schema:item <https://example.org/place/1> ] .
+<https://example.org/work/1> a schema:CreativeWork ; schema:name "Work 1" ; schema:contentLocation <https://example.org/place/1> .
+<https://example.org/place/1> a schema:Place ; schema:name "Place 1" .
+''')
+    file = File('downloads/test-schema-feed-c.ttl')
+    extract = schema.Feed(file, True)
+    #print(extract)
+    for element in extract.feed_elements:
+        if element.element_uri.uri == 'https://example.org/work/1':
+            if element.vocab_further.uri_labels[0].labels:
+                print('Sibling element keeps its label')
+            else:
+                print('Sibling element lost its label')
+    extract.map_and_save('csv', 'downloads/test-schema-feed-c')
+    extract.map_and_save('parquet', 'downloads/test-schema-feed-c')
+
 # Schema.org element A
 if 'schema-element-a' in tests:
     file = File('https://corpusvitrearum.de/cvma-digital/bildarchiv.html?tx_cvma_archive[image]=13494&tx_cvma_archive[action]=show&tx_cvma_archive[controller]=Gallery&cHash=0c57f24f32400787b3ae9b00daed634e')